@@ -5,41 +5,205 @@ Scrapes Amazon autocomplete suggestions using advanced anti-detection techniques
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
+import os
+import functools
+import gzip
+import importlib.util
 import random
+import re
+import bisect
+import itertools
 import string
 import sys
+import threading
 import asyncio
 import aiohttp
 import concurrent.futures
 from datetime import datetime
 
+# orjson decodes the autocomplete payloads (and encodes output) several times faster when installed
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(data, indent=False):
+        """Serialize data to UTF-8 JSON bytes"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(data, indent=False):
+        """Serialize data to UTF-8 JSON bytes"""
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+# Only advertise brotli when requests/aiohttp have a decoder for it
+if any(importlib.util.find_spec(module) for module in ('brotli', 'brotlicffi')):
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+else:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Unicode replacements for Windows consoles, compiled once at import time
+SAFE_PRINT_REPLACEMENTS = {
+    '✅': '[OK]',
+    '❌': '[ERROR]',
+    '⚠️': '[WARNING]',
+    '🔍': '[SEARCH]',
+    '📊': '[STATS]',
+    '💾': '[SAVE]',
+    '🔄': '[RETRY]',
+    '🚀': '[START]',
+    '🎯': '[TARGET]'
+}
+SAFE_PRINT_PATTERN = re.compile('|'.join(map(re.escape, SAFE_PRINT_REPLACEMENTS)))
+
 def safe_print(message):
     """Print message with Unicode characters replaced for Windows compatibility"""
-    if sys.platform == "win32":
-        replacements = {
-            '✅': '[OK]',
-            '❌': '[ERROR]',
-            '⚠️': '[WARNING]',
-            '🔍': '[SEARCH]',
-            '📊': '[STATS]',
-            '💾': '[SAVE]',
-            '🔄': '[RETRY]',
-            '🚀': '[START]',
-            '🎯': '[TARGET]'
-        }
-        for unicode_char, replacement in replacements.items():
-            message = message.replace(unicode_char, replacement)
-    print(message)
+    if sys.platform == "win32" and not message.isascii():
+        message = SAFE_PRINT_PATTERN.sub(lambda match: SAFE_PRINT_REPLACEMENTS[match.group(0)], message)
+    # One write per line so messages from worker threads don't interleave with newlines
+    sys.stdout.write(f"{message}\n")
+
+# Letter combinations appended to the base keyword when searching
+VOWELS = ('a', 'e', 'i', 'o', 'u')
+COMMON_CONSONANTS = ('b', 'c', 'd', 'f', 'g', 'h', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v')
+CONSONANT_PAIRS = (
+    # Common blends with 'l'
+    'bl', 'cl', 'fl', 'gl', 'pl', 'sl',
+    # Common blends with 'r'
+    'br', 'cr', 'dr', 'fr', 'gr', 'pr', 'tr',
+    # 's' combinations
+    'sc', 'sh', 'sk', 'sl', 'sm', 'sn', 'sp', 'st', 'sw',
+    # Other common pairs
+    'ch', 'gh', 'ph', 'th', 'wh', 'wr',
+    # Additional useful combinations
+    'dw', 'gn', 'kn', 'mb', 'mp', 'nd', 'ng', 'nk', 'nt',
+    'pt', 'qu', 'rh', 'rn', 'rt', 'sch', 'tch', 'tw'
+)
+SEARCH_PATTERN_SUFFIXES = tuple(itertools.chain(
+    # Single letters (a-z)
+    string.ascii_lowercase,
+    # Vowel + consonant combinations
+    (vowel + consonant for vowel in VOWELS for consonant in COMMON_CONSONANTS),
+    # Consonant + vowel combinations
+    (consonant + vowel for consonant in COMMON_CONSONANTS for vowel in VOWELS),
+    # Common consonant + consonant combinations
+    CONSONANT_PAIRS
+))
+
+MARKETS_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'markets.json')
+FALLBACK_MARKET_CONFIG = {
+    "name": "France",
+    "amazon_tld": ".fr",
+    "language": "french",
+    "locale": "fr-FR",
+    "currency": "EUR"
+}
+
+@functools.lru_cache(maxsize=1)
+def load_markets_file():
+    """Read and parse config/markets.json once per process"""
+    with open(MARKETS_CONFIG_PATH, 'rb') as f:
+        return json_loads(f.read())
+
+def backoff_delay(attempt, retry_after=None):
+    """Seconds to wait before retrying: the server's Retry-After, else capped exponential backoff with jitter"""
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.1)
+        except ValueError:
+            pass  # HTTP-date form, fall back to backoff
+    return min(32, 2 ** (attempt + 1)) + random.uniform(0, 0.5)
+
+# Amazon marketplace IDs by top-level domain
+MARKETPLACE_IDS = {
+    ".fr": "A13V1IB3VIYZZH",  # Correct marketplace ID for France
+    ".de": "A1PA6795UKMFR9",
+    ".es": "A1RKKUPIHCS9HS",
+    ".it": "APJ6JRA9NG5V4",
+    ".nl": "A1805IZSGTT6HS",
+    ".pl": "A1C3SOZRARQ6R3",
+    ".se": "A2NODRKZP88ZB9",
+    ".com": "ATVPDKIKX0DER",
+    ".ca": "A2EUQ1WTGCTBG2",
+    ".com.mx": "A1AM78C64UM0Y8",
+    ".com.br": "A2Q3Y263D00KWC",
+    ".co.uk": "A1F83G8C2ARO7P",
+    ".be": "AMEN7PMS3EDWL",
+    ".co.za": "AE08WJ6YKNBMC",
+    ".eg": "ARBP9OOSHTCHU",
+    ".com.tr": "A33AVAJ2PDY3EV",
+    ".sa": "A17E79C6D8DWNP",
+    ".ae": "A2VIGQ35RCS4UG",
+    ".in": "A21TJRUUN4KGV"
+}
+
+# Cached autocomplete suggestions are reused for a day
+SUGGESTION_CACHE_TTL = 24 * 60 * 60
+
+class TokenBucketLimiter:
+    """Token bucket that paces requests to a steady rate without batch barriers"""
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self):
+        """Take one token and return how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire(self):
+        """Block the current thread until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 class AdvancedAmazonKeywordScraper:
-    def __init__(self, base_keyword="friteuse", market="fr"):
+    def __init__(self, base_keyword="friteuse", market="fr", use_cache=True):
         self.base_keyword = base_keyword
+        self._base_lower = base_keyword.lower()
+        self._base_lower_len = len(self._base_lower)
         self.market = market
         self.config = self.load_market_config(market)
+        # Every keyword string has to be kept for the output files, so a set of the strings
+        # themselves is the leanest dedup structure (one slot per keyword, no extra objects)
         self.all_keywords = set()
         
+        # Category (2-word) and subcategory (3+ word) keywords, kept sorted as they arrive
+        self.category_keywords = []
+        self.subcategory_keywords = []
+        
+        # Request invariants, built once per scraper
+        self._mid = self.get_marketplace_id()
+        self._suggest_url = f"https://completion.amazon{self.config['amazon_tld']}/api/2017/suggestions"
+        self._base_params = {"mid": self._mid, "alias": "aps"}
+        
+        # Token bucket pacing requests in parallel modes (None = unpaced)
+        self.rate_limiter = None
+        
+        # On-disk cache of suggestions per pattern, reused across runs for a day
+        self.use_cache = use_cache
+        self.cache_file = f"data/keyword_suggestions_cache_{self.market}.json"
+        self.cache_lock = threading.Lock()
+        self.suggestion_cache = self.load_suggestion_cache() if use_cache else {}
+        
         # User agents for rotation
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -49,34 +213,107 @@ class AdvancedAmazonKeywordScraper:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         ]
         
+        # Browser-like headers shared by the requests and aiohttp sessions
+        self.default_headers = self.build_default_headers()
+        
         # Setup session
         self.session = self.setup_session()
     
-    def setup_session(self):
-        """Setup session with proper headers"""
+    def setup_session(self, pool_size=10):
+        """Setup session with proper headers and a connection pool sized for pool_size threads"""
         session = requests.Session()
         
-        # Headers to mimic real browser with market-specific language
-        session.headers.update({
+        # Size the pool to the worker count so threads never wait on (or bypass) the pool;
+        # retries are handled in get_amazon_suggestions
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size * 2, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        session.headers.update(self.default_headers)
+        
+        return session
+    
+    def build_default_headers(self):
+        """Headers to mimic real browser with market-specific language"""
+        return {
             'User-Agent': random.choice(self.user_agents),
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': f'{self.config["locale"]},{self.config["language"][:2]};q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Cache-Control': 'no-cache',
-        })
-        
-        return session
+        }
+    
+    def create_async_session(self, max_concurrent):
+        """Create an aiohttp session that keeps a small pool of connections alive to the completion host"""
+        # Every request goes to the same host, so reuse the TLS connections instead of
+        # opening a new one per request
+        connector = aiohttp.TCPConnector(
+            limit=max_concurrent,
+            limit_per_host=max_concurrent,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True
+        )
+        timeout = aiohttp.ClientTimeout(total=10, connect=3, sock_read=7)
+        
+        # Headers are set once for the session instead of on every request
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.default_headers)
     
 
     
+    def load_suggestion_cache(self):
+        """Load cached pattern suggestions from file"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'rb') as f:
+                    cache = json_loads(f.read())
+                safe_print(f"[CACHE] Loaded {len(cache)} cached patterns from {self.cache_file}")
+                return cache
+        except Exception as e:
+            safe_print(f"[WARNING] Could not load suggestion cache: {e}")
+        return {}
+    
+    def save_suggestion_cache(self):
+        """Save unexpired pattern suggestions to file"""
+        if not self.use_cache:
+            return
+        try:
+            now = time.time()
+            with self.cache_lock:
+                cache = {key: entry for key, entry in self.suggestion_cache.items()
+                         if now - entry['timestamp'] < SUGGESTION_CACHE_TTL}
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(json_dumps(cache))
+            os.replace(temp_file, self.cache_file)
+            safe_print(f"[CACHE] Saved {len(cache)} cached patterns to {self.cache_file}")
+        except Exception as e:
+            safe_print(f"[WARNING] Could not save suggestion cache: {e}")
+    
+    def get_cached_suggestions(self, search_term):
+        """Return cached suggestions for a pattern, or None if missing or expired"""
+        if not self.use_cache:
+            return None
+        entry = self.suggestion_cache.get(f"{self._base_lower}:{search_term}")
+        if entry and time.time() - entry['timestamp'] < SUGGESTION_CACHE_TTL:
+            return set(entry['suggestions'])
+        return None
+    
+    def cache_suggestions(self, search_term, suggestions):
+        """Remember the suggestions returned for a pattern"""
+        if self.use_cache:
+            with self.cache_lock:
+                self.suggestion_cache[f"{self._base_lower}:{search_term}"] = {
+                    'timestamp': time.time(),
+                    'suggestions': sorted(suggestions)
+                }
+    
     def load_market_config(self, market):
         """Load market configuration from config file"""
         try:
-            import os
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'markets.json')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                markets_config = json.load(f)
+            markets_config = load_markets_file()
             
             if market not in markets_config['markets']:
                 safe_print(f"[WARNING] Market '{market}' not found, using default 'fr'")
@@ -86,53 +323,50 @@ class AdvancedAmazonKeywordScraper:
         except Exception as e:
             safe_print(f"[ERROR] Could not load market config: {e}")
             # Fallback to French market
-            return {
-                "name": "France",
-                "amazon_tld": ".fr",
-                "language": "french",
-                "locale": "fr-FR",
-                "currency": "EUR"
-            }
+            return dict(FALLBACK_MARKET_CONFIG)
     
 
     
-    def get_amazon_suggestions(self, search_term, retries=2):
-        """Get autocomplete suggestions from Amazon with retry logic"""
-        url = f"https://completion.amazon{self.config['amazon_tld']}/api/2017/suggestions"
+    def get_amazon_suggestions(self, search_term, retries=4):
+        """Get autocomplete suggestions from Amazon (as a set) with retry logic"""
+        url = self._suggest_url
+        params = {**self._base_params, "prefix": search_term}
+        retry_delay = 0
         
-        params = {
-            "mid": self.get_marketplace_id(),
-            "alias": "aps",
-            "prefix": search_term
-        }
+        cached = self.get_cached_suggestions(search_term)
+        if cached is not None:
+            return cached
         
         for attempt in range(retries):
             try:
                 # Adaptive timeout based on attempt
                 timeout = 10 + (attempt * 5)  # Increase timeout for retries
                 
-                # Adaptive delay based on attempt
+                # Adaptive delay based on attempt (or on what the server asked for)
                 if attempt > 0:
-                    delay = random.uniform(1, 2 ** attempt)  # Exponential backoff
+                    delay = retry_delay or random.uniform(1, 2 ** attempt)  # Exponential backoff
+                    retry_delay = 0
                     safe_print(f"  [RETRY] Attempt {attempt + 1}/{retries}: Waiting {delay:.1f}s...")
                     time.sleep(delay)
                 
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+                
                 response = self.session.get(url, params=params, timeout=timeout)
-                response.raise_for_status()
                 
-                data = response.json()
-                suggestions = []
+                # Back off only when Amazon is rate limiting or failing
+                if response.status_code == 429 or response.status_code >= 500:
+                    retry_delay = backoff_delay(attempt, response.headers.get('Retry-After'))
+                    safe_print(f"  [RETRY] '{search_term}' HTTP {response.status_code} on attempt {attempt + 1}")
+                    continue
+                
+                response.raise_for_status()
                 
-                if 'suggestions' in data:
-                    for suggestion in data['suggestions']:
-                        if 'value' in suggestion:
-                            keyword = suggestion['value'].strip().lower()
-                            base_lower = self.base_keyword.lower()
-                            # Only include keywords that start with base keyword and are not just the base keyword
-                            if keyword and keyword.startswith(base_lower) and keyword != base_lower:
-                                suggestions.append(keyword)
+                data = json_loads(response.content)
+                suggestions = self.filter_suggestions(data)
                 
                 safe_print(f"  [SUCCESS] '{search_term}': {len(suggestions)} suggestions on attempt {attempt + 1}")
+                self.cache_suggestions(search_term, suggestions)
                 return suggestions
                 
             except requests.exceptions.Timeout as e:
@@ -164,140 +398,64 @@ class AdvancedAmazonKeywordScraper:
                     safe_print(f"  [ERROR] All attempts failed for '{search_term}': {str(e)}")
         
         safe_print(f"  [WARNING] '{search_term}': No suggestions after {retries} attempts")
-        return []
+        return set()
+    
+    def filter_suggestions(self, data):
+        """Extract suggestion keywords that extend the base keyword from an autocomplete response"""
+        base_lower = self._base_lower
+        base_lower_len = self._base_lower_len
+        suggestions = set()
+        add_suggestion = suggestions.add
+        
+        for suggestion in data.get('suggestions', ()):
+            keyword = suggestion.get('value')
+            if not keyword:
+                continue
+            
+            # Amazon normally returns trimmed lowercase values, so only normalise when needed
+            if not keyword.islower():
+                keyword = keyword.lower()
+            if keyword[0].isspace() or keyword[-1].isspace():
+                keyword = keyword.strip()
+            
+            # Only include keywords that start with base keyword and are not just the base keyword
+            if len(keyword) > base_lower_len and keyword.startswith(base_lower):
+                add_suggestion(keyword)
+        
+        return suggestions
     
     def get_marketplace_id(self):
         """Get marketplace ID for the current market"""
-        marketplace_ids = {
-            ".fr": "A13V1IB3VIYZZH",  # Correct marketplace ID for France
-            ".de": "A1PA6795UKMFR9", 
-            ".es": "A1RKKUPIHCS9HS",
-            ".it": "APJ6JRA9NG5V4",
-            ".nl": "A1805IZSGTT6HS",
-            ".pl": "A1C3SOZRARQ6R3",
-            ".se": "A2NODRKZP88ZB9",
-            ".com": "ATVPDKIKX0DER",
-            ".ca": "A2EUQ1WTGCTBG2",
-            ".com.mx": "A1AM78C64UM0Y8",
-            ".com.br": "A2Q3Y263D00KWC",
-            ".co.uk": "A1F83G8C2ARO7P",
-            ".be": "AMEN7PMS3EDWL",
-            ".co.za": "AE08WJ6YKNBMC",
-            ".eg": "ARBP9OOSHTCHU",
-            ".com.tr": "A33AVAJ2PDY3EV",
-            ".sa": "A17E79C6D8DWNP",
-            ".ae": "A2VIGQ35RCS4UG",
-            ".in": "A21TJRUUN4KGV"
-        }
-        return marketplace_ids.get(self.config['amazon_tld'], "A13V1IB3VIYZZH")
+        return MARKETPLACE_IDS.get(self.config['amazon_tld'], "A13V1IB3VIYZZH")
+    
+    def build_search_patterns(self, prefixes, suffixes=SEARCH_PATTERN_SUFFIXES):
+        """Build "<prefix> <suffix>" search patterns for every prefix and suffix"""
+        return [f"{prefix} {suffix}" for prefix in prefixes for suffix in suffixes]
     
     def generate_stage1_patterns(self):
         """Generate Stage 1 patterns: comprehensive search to find all main categories"""
-        search_patterns = []
-        
-        # Single letters (a-z)
-        for letter in string.ascii_lowercase:
-            search_patterns.append(f"{self.base_keyword} {letter}")
-        
-        # Two-letter combinations (comprehensive approach)
-        vowels = ['a', 'e', 'i', 'o', 'u']
-        common_consonants = ['b', 'c', 'd', 'f', 'g', 'h', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v']
-        
-        # Vowel + consonant combinations
-        for vowel in vowels:
-            for consonant in common_consonants:
-                search_patterns.append(f"{self.base_keyword} {vowel}{consonant}")
-        
-        # Consonant + vowel combinations
-        for consonant in common_consonants:
-            for vowel in vowels:
-                search_patterns.append(f"{self.base_keyword} {consonant}{vowel}")
-        
-        # Common consonant + consonant combinations
-        consonant_pairs = [
-            # Common blends with 'l'
-            'bl', 'cl', 'fl', 'gl', 'pl', 'sl',
-            # Common blends with 'r'  
-            'br', 'cr', 'dr', 'fr', 'gr', 'pr', 'tr',
-            # 's' combinations
-            'sc', 'sh', 'sk', 'sl', 'sm', 'sn', 'sp', 'st', 'sw',
-            # Other common pairs
-            'ch', 'gh', 'ph', 'th', 'wh', 'wr',
-            # Additional useful combinations
-            'dw', 'gn', 'kn', 'mb', 'mp', 'nd', 'ng', 'nk', 'nt',
-            'pt', 'qu', 'rh', 'rn', 'rt', 'sch', 'tch', 'tw'
-        ]
-        
-        for pair in consonant_pairs:
-            search_patterns.append(f"{self.base_keyword} {pair}")
-        
-        return search_patterns
+        return self.build_search_patterns((self.base_keyword,))
     
     def generate_stage2_patterns(self, main_categories):
         """Generate Stage 2 patterns: expand each main category with letters"""
-        search_patterns = []
-        
-        for category in main_categories:
-            # Add single letters to each main category
-            for letter in string.ascii_lowercase:
-                search_patterns.append(f"{category} {letter}")
-        
-        return search_patterns
+        # Add single letters to each main category
+        return self.build_search_patterns(main_categories, string.ascii_lowercase)
     
     def generate_enhanced_search_patterns(self):
         """Generate enhanced search patterns for comprehensive keyword discovery"""
-        search_patterns = []
-        
-        # Single letters (a-z)
-        for letter in string.ascii_lowercase:
-            search_patterns.append(f"{self.base_keyword} {letter}")
-        
-        # Two-letter combinations (comprehensive approach)
-        vowels = ['a', 'e', 'i', 'o', 'u']
-        common_consonants = ['b', 'c', 'd', 'f', 'g', 'h', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v']
-        
-        # Vowel + consonant combinations
-        for vowel in vowels:
-            for consonant in common_consonants:
-                search_patterns.append(f"{self.base_keyword} {vowel}{consonant}")
-        
-        # Consonant + vowel combinations
-        for consonant in common_consonants:
-            for vowel in vowels:
-                search_patterns.append(f"{self.base_keyword} {consonant}{vowel}")
-        
-        # Common consonant + consonant combinations
-        consonant_pairs = [
-            # Common blends with 'l'
-            'bl', 'cl', 'fl', 'gl', 'pl', 'sl',
-            # Common blends with 'r'  
-            'br', 'cr', 'dr', 'fr', 'gr', 'pr', 'tr',
-            # 's' combinations
-            'sc', 'sh', 'sk', 'sl', 'sm', 'sn', 'sp', 'st', 'sw',
-            # Other common pairs
-            'ch', 'gh', 'ph', 'th', 'wh', 'wr',
-            # Additional useful combinations
-            'dw', 'gn', 'kn', 'mb', 'mp', 'nd', 'ng', 'nk', 'nt',
-            'pt', 'qu', 'rh', 'rn', 'rt', 'sch', 'tch', 'tw'
-        ]
-        
-        for pair in consonant_pairs:
-            search_patterns.append(f"{self.base_keyword} {pair}")
-        
-        return search_patterns
+        return self.build_search_patterns((self.base_keyword,))
     
     def filter_to_two_words(self, keywords):
         """Filter keywords to keep only 2-word combinations (main categories)"""
-        two_word_keywords = []
-        base_lower = self.base_keyword.lower()
+        two_word_keywords = set()
         
         for keyword in keywords:
             words = keyword.strip().split()
             # Keep only keywords with exactly 2 words that start with base keyword
-            if len(words) == 2 and words[0].lower() == base_lower:
-                two_word_keywords.append(keyword)
+            if len(words) == 2 and words[0].lower() == self._base_lower:
+                two_word_keywords.add(keyword)
         
-        return list(set(two_word_keywords))  # Remove duplicates
+        return list(two_word_keywords)
 
     async def scrape_2_stage_async(self, max_concurrent=10):
         """2-Stage async scraping: Stage 1 for main categories, Stage 2 for subcategories"""
@@ -310,28 +468,20 @@ class AdvancedAmazonKeywordScraper:
         safe_print(f"[STATS] Stage 1: {len(stage1_patterns)} patterns with {max_concurrent} concurrent requests")
         
         stage1_keywords = set()
-        batch_size = max_concurrent
+        self.rate_limiter = TokenBucketLimiter(max_concurrent * 2)
         
-        async with aiohttp.ClientSession() as session:
+        async with self.create_async_session(max_concurrent) as session:
             # Process Stage 1
-            for i in range(0, len(stage1_patterns), batch_size):
-                batch = stage1_patterns[i:i+batch_size]
-                safe_print(f"[SEARCH] Stage 1 batch {i//batch_size + 1}/{(len(stage1_patterns) + batch_size - 1)//batch_size}")
-                
-                tasks = [self.get_amazon_suggestions_async(session, pattern) for pattern in batch]
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in batch_results:
-                    if isinstance(result, tuple):
-                        pattern, suggestions = result
-                        if suggestions:
-                            for keyword in suggestions:
-                                stage1_keywords.add(keyword)
-                            safe_print(f"  [OK] '{pattern}': {len(suggestions)} suggestions")
-                        else:
-                            safe_print(f"  [WARNING] '{pattern}': No suggestions")
-                
-                await asyncio.sleep(0.5)
+            stage1_results = await self.gather_suggestions_async(session, stage1_patterns, max_concurrent)
+            
+            for result in stage1_results:
+                if isinstance(result, tuple):
+                    pattern, suggestions = result
+                    if suggestions:
+                        stage1_keywords |= suggestions
+                        safe_print(f"  [OK] '{pattern}': {len(suggestions)} suggestions")
+                    else:
+                        safe_print(f"  [WARNING] '{pattern}': No suggestions")
             
             # Filter to get main categories (2-word combinations only)
             main_categories = self.filter_to_two_words(list(stage1_keywords))
@@ -348,89 +498,75 @@ class AdvancedAmazonKeywordScraper:
                 safe_print(f"[STATS] Stage 2: {len(stage2_patterns)} patterns from {len(main_categories)} main categories")
                 
                 # Process Stage 2
-                for i in range(0, len(stage2_patterns), batch_size):
-                    batch = stage2_patterns[i:i+batch_size]
-                    safe_print(f"[SEARCH] Stage 2 batch {i//batch_size + 1}/{(len(stage2_patterns) + batch_size - 1)//batch_size}")
-                    
-                    tasks = [self.get_amazon_suggestions_async(session, pattern) for pattern in batch]
-                    batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    for result in batch_results:
-                        if isinstance(result, tuple):
-                            pattern, suggestions = result
-                            if suggestions:
-                                new_keywords = 0
-                                for keyword in suggestions:
-                                    if keyword not in self.all_keywords:
-                                        self.all_keywords.add(keyword)
-                                        new_keywords += 1
-                                if new_keywords > 0:
-                                    safe_print(f"  [OK] '{pattern}': {len(suggestions)} suggestions ({new_keywords} new)")
-                    
-                    await asyncio.sleep(0.5)
+                stage2_results = await self.gather_suggestions_async(session, stage2_patterns, max_concurrent)
+                
+                for result in stage2_results:
+                    if isinstance(result, tuple):
+                        pattern, suggestions = result
+                        if suggestions:
+                            new_keywords = self.add_new_keywords(suggestions)
+                            if new_keywords > 0:
+                                safe_print(f"  [OK] '{pattern}': {len(suggestions)} suggestions ({new_keywords} new)")
             
             # Add main categories to final results
-            for category in main_categories:
-                self.all_keywords.add(category)
+            self.add_new_keywords(set(main_categories))
         
+        self.save_suggestion_cache()
         safe_print(f"\n[FINAL] Total keywords found: {len(self.all_keywords)}")
         return list(self.all_keywords)
 
-    async def get_amazon_suggestions_async(self, session, search_term, retries=2):
-        """Async version of get_amazon_suggestions with retry logic"""
-        url = f"https://completion.amazon{self.config['amazon_tld']}/api/2017/suggestions"
+    async def gather_suggestions_async(self, session, search_patterns, max_concurrent):
+        """Fetch suggestions for all patterns, with a semaphore keeping max_concurrent requests in flight"""
+        semaphore = asyncio.Semaphore(max_concurrent)
         
-        params = {
-            "mid": self.get_marketplace_id(),
-            "alias": "aps",
-            "prefix": search_term
-        }
+        async def fetch(pattern):
+            async with semaphore:
+                return await self.get_amazon_suggestions_async(session, pattern)
         
-        headers = {
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': f'{self.config["locale"]},{self.config["language"][:2]};q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache',
-        }
+        return await asyncio.gather(*(fetch(pattern) for pattern in search_patterns), return_exceptions=True)
+
+    async def get_amazon_suggestions_async(self, session, search_term, retries=4):
+        """Async version of get_amazon_suggestions with retry logic"""
+        url = self._suggest_url
+        params = {**self._base_params, "prefix": search_term}
+        retry_delay = 0
+        
+        cached = self.get_cached_suggestions(search_term)
+        if cached is not None:
+            return search_term, cached
         
         for attempt in range(retries):
             try:
                 # Adaptive timeout based on attempt
                 timeout = 10 + (attempt * 5)  # Increase timeout for retries
                 
-                # Adaptive delay based on attempt
+                # Adaptive delay based on attempt (or on what the server asked for)
                 if attempt > 0:
-                    delay = random.uniform(1, 2 ** attempt)  # Exponential backoff
+                    delay = retry_delay or random.uniform(1, 2 ** attempt)  # Exponential backoff
+                    retry_delay = 0
                     safe_print(f"  [RETRY] '{search_term}' attempt {attempt + 1}/{retries}: Waiting {delay:.1f}s...")
                     await asyncio.sleep(delay)
                 
-                async with session.get(url, params=params, headers=headers, timeout=timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        suggestions = []
-                        
-                        if 'suggestions' in data:
-                            for suggestion in data['suggestions']:
-                                if 'value' in suggestion:
-                                    keyword = suggestion['value'].strip().lower()
-                                    base_lower = self.base_keyword.lower()
-                                    # Only include keywords that start with base keyword and are not just the base keyword
-                                    if keyword and keyword.startswith(base_lower) and keyword != base_lower:
-                                        suggestions.append(keyword)
-                        
-                        safe_print(f"  [SUCCESS] '{search_term}': {len(suggestions)} suggestions on attempt {attempt + 1}")
-                        return search_term, suggestions
-                    else:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async()
+                
+                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout, connect=3)) as response:
+                    # Back off only when Amazon is rate limiting or failing
+                    if response.status == 429 or response.status >= 500:
+                        retry_delay = backoff_delay(attempt, response.headers.get('Retry-After'))
                         safe_print(f"  [RETRY] '{search_term}' HTTP {response.status} on attempt {attempt + 1}")
-                        if attempt < retries - 1:
-                            await asyncio.sleep(random.uniform(1, 3))
-                            continue
-                        else:
-                            safe_print(f"  [ERROR] '{search_term}' failed after {retries} attempts with HTTP {response.status}")
-                            return search_term, []
-                            
+                        continue
+                    
+                    # Any other error status is raised and retried as a client error
+                    response.raise_for_status()
+                    
+                    data = json_loads(await response.read())
+                    suggestions = self.filter_suggestions(data)
+                    
+                    safe_print(f"  [SUCCESS] '{search_term}': {len(suggestions)} suggestions on attempt {attempt + 1}")
+                    self.cache_suggestions(search_term, suggestions)
+                    return search_term, suggestions
+                    
             except asyncio.TimeoutError as e:
                 safe_print(f"  [RETRY] Timeout for '{search_term}' on attempt {attempt + 1}: {str(e)}")
                 if attempt < retries - 1:
@@ -453,7 +589,7 @@ class AdvancedAmazonKeywordScraper:
                     safe_print(f"  [ERROR] All attempts failed for '{search_term}': {str(e)}")
         
         safe_print(f"  [WARNING] '{search_term}': No suggestions after {retries} attempts")
-        return search_term, []
+        return search_term, set()
 
     async def scrape_with_letters_async(self, max_concurrent=10):
         """Fast async scraping with concurrent requests"""
@@ -466,44 +602,25 @@ class AdvancedAmazonKeywordScraper:
         total_patterns = len(search_patterns)
         safe_print(f"[STATS] Will search {total_patterns} patterns with {max_concurrent} concurrent requests")
         
-        # Process in batches to avoid overwhelming the server
-        batch_size = max_concurrent
-        all_results = []
+        # Keep max_concurrent requests in flight, paced by a token bucket to avoid overwhelming the server
+        self.rate_limiter = TokenBucketLimiter(max_concurrent * 2)
         
-        async with aiohttp.ClientSession() as session:
-            for i in range(0, len(search_patterns), batch_size):
-                batch = search_patterns[i:i+batch_size]
-                safe_print(f"[SEARCH] Processing batch {i//batch_size + 1}/{(total_patterns + batch_size - 1)//batch_size}")
-                
-                # Create tasks for this batch
-                tasks = []
-                for pattern in batch:
-                    task = self.get_amazon_suggestions_async(session, pattern)
-                    tasks.append(task)
-                
-                # Execute batch concurrently
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results
-                for result in batch_results:
-                    if isinstance(result, tuple):
-                        pattern, suggestions = result
-                        if suggestions:
-                            new_keywords = 0
-                            for keyword in suggestions:
-                                if keyword not in self.all_keywords:
-                                    self.all_keywords.add(keyword)
-                                    new_keywords += 1
-                            safe_print(f"  [OK] '{pattern}': {len(suggestions)} suggestions ({new_keywords} new)")
-                        else:
-                            safe_print(f"  [WARNING] '{pattern}': No suggestions")
+        async with self.create_async_session(max_concurrent) as session:
+            results = await self.gather_suggestions_async(session, search_patterns, max_concurrent)
+            
+            # Process results
+            for result in results:
+                if isinstance(result, tuple):
+                    pattern, suggestions = result
+                    if suggestions:
+                        new_keywords = self.add_new_keywords(suggestions)
+                        safe_print(f"  [OK] '{pattern}': {len(suggestions)} suggestions ({new_keywords} new)")
                     else:
-                        safe_print(f"  [ERROR] Exception in batch: {result}")
-                
-                # Small delay between batches
-                if i + batch_size < len(search_patterns):
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
+                        safe_print(f"  [WARNING] '{pattern}': No suggestions")
+                else:
+                    safe_print(f"  [ERROR] Exception while scraping: {result}")
         
+        self.save_suggestion_cache()
         safe_print(f"[STATS] Total unique keywords collected: {len(self.all_keywords)}")
         return list(self.all_keywords)
 
@@ -523,36 +640,32 @@ class AdvancedAmazonKeywordScraper:
             suggestions = self.get_amazon_suggestions(pattern)
             return pattern, suggestions
         
-        # Process patterns in parallel batches
-        batch_size = max_workers * 2
+        # Connection pool large enough for every worker thread; close the default-sized
+        # session first so its pooled connections are released
+        if max_workers > 10:
+            self.session.close()
+            self.session = self.setup_session(pool_size=max_workers)
         
-        for i in range(0, len(search_patterns), batch_size):
-            batch = search_patterns[i:i+batch_size]
-            safe_print(f"[SEARCH] Processing batch {i//batch_size + 1}/{(total_patterns + batch_size - 1)//batch_size}")
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_pattern = {executor.submit(process_pattern, pattern): pattern for pattern in batch}
-                
-                for future in concurrent.futures.as_completed(future_to_pattern):
-                    try:
-                        pattern, suggestions = future.result()
-                        if suggestions:
-                            new_keywords = 0
-                            for keyword in suggestions:
-                                if keyword not in self.all_keywords:
-                                    self.all_keywords.add(keyword)
-                                    new_keywords += 1
-                            safe_print(f"  [OK] '{pattern}': {len(suggestions)} suggestions ({new_keywords} new)")
-                        else:
-                            safe_print(f"  [WARNING] '{pattern}': No suggestions")
-                    except Exception as exc:
-                        pattern = future_to_pattern[future]
-                        safe_print(f"  [ERROR] '{pattern}' failed: {exc}")
+        # One pool for the whole run; the executor queue keeps max_workers requests
+        # in flight and the token bucket paces them
+        self.rate_limiter = TokenBucketLimiter(max_workers * 2)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_pattern = {executor.submit(process_pattern, pattern): pattern for pattern in search_patterns}
             
-            # Small delay between batches
-            if i + batch_size < len(search_patterns):
-                time.sleep(random.uniform(0.5, 1.5))
+            for completed, future in enumerate(concurrent.futures.as_completed(future_to_pattern), 1):
+                try:
+                    pattern, suggestions = future.result()
+                    if suggestions:
+                        new_keywords = self.add_new_keywords(suggestions)
+                        safe_print(f"  [OK] ({completed}/{total_patterns}) '{pattern}': {len(suggestions)} suggestions ({new_keywords} new)")
+                    else:
+                        safe_print(f"  [WARNING] ({completed}/{total_patterns}) '{pattern}': No suggestions")
+                except Exception as exc:
+                    pattern = future_to_pattern[future]
+                    safe_print(f"  [ERROR] '{pattern}' failed: {exc}")
         
+        self.save_suggestion_cache()
         safe_print(f"[STATS] Total unique keywords collected: {len(self.all_keywords)}")
         return list(self.all_keywords)
 
@@ -574,11 +687,7 @@ class AdvancedAmazonKeywordScraper:
             suggestions = self.get_amazon_suggestions(pattern)
             
             if suggestions:
-                new_keywords = 0
-                for keyword in suggestions:
-                    if keyword not in self.all_keywords:
-                        self.all_keywords.add(keyword)
-                        new_keywords += 1
+                new_keywords = self.add_new_keywords(suggestions)
                 
                 safe_print(f"  [OK] Found {len(suggestions)} suggestions ({new_keywords} new)")
             else:
@@ -587,6 +696,7 @@ class AdvancedAmazonKeywordScraper:
             # Reduced rate limiting for speed
             time.sleep(random.uniform(0.3, 0.8))
         
+        self.save_suggestion_cache()
         safe_print(f"[STATS] Total unique keywords collected: {len(self.all_keywords)}")
         return list(self.all_keywords)
     
@@ -599,48 +709,91 @@ class AdvancedAmazonKeywordScraper:
         os.makedirs(data_dir, exist_ok=True)
         
         # Save as simple keywords.txt
-        txt_file = os.path.join(data_dir, 'keywords.txt')
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            for keyword in sorted(keywords):
-                f.write(f"{keyword}\n")
+        txt_file = self.write_keywords_file(os.path.join(data_dir, 'keywords.txt'), sorted(keywords))
         
         safe_print(f"[SAVE] Keywords saved to: {txt_file}")
         safe_print(f"[SAVE] Total keywords saved: {len(keywords)}")
         
         return txt_file
 
+    def write_keywords_file(self, file_path, keywords):
+        """Write already-sorted keywords to a text file, one per line"""
+        # Encode the whole file up front and hand it to the OS in one write
+        payload = memoryview("".join(f"{keyword}\n" for keyword in keywords).encode('utf-8'))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            while payload:
+                payload = payload[os.write(fd, payload):]
+        finally:
+            os.close(fd)
+        
+        return file_path
+
+    def add_new_keywords(self, keywords):
+        """Add a set of keywords to the results, filing new ones into the sorted structure lists"""
+        new_keywords = keywords - self.all_keywords
+        if not new_keywords:
+            return 0
+        self.all_keywords |= new_keywords
+        
+        for keyword in new_keywords:
+            keyword_type = self.classify_keyword(keyword)
+            if keyword_type == 'category':
+                bisect.insort(self.category_keywords, keyword)
+            elif keyword_type == 'subcategory':
+                bisect.insort(self.subcategory_keywords, keyword)
+        
+        return len(new_keywords)
+
+    def classify_keyword(self, keyword):
+        """Classify a keyword as 'category' (2 words), 'subcategory' (3+ words) or None"""
+        words = keyword.strip().split()
+        if len(words) < 2:
+            return None
+        
+        # Skip if keyword doesn't start with base keyword
+        if not keyword.lower().startswith(self._base_lower):
+            return None
+        
+        # Remove base keyword to count additional words
+        remaining_words = keyword[self._base_lower_len:].strip().split()
+        
+        # Category: exactly 1 additional word (e.g., "patinete electrico joyor")
+        if len(remaining_words) == 1:
+            return 'category'
+        
+        # Subcategory: 2+ additional words (e.g., "patinete electrico joyor acelerador")
+        if len(remaining_words) >= 2:
+            return 'subcategory'
+        
+        return None
+
     def extract_structured_keywords(self, all_keywords):
         """Extract structured keywords: categories (2 words) and subcategories (3+ words)"""
         safe_print(f"[STRUCTURE] Analyzing {len(all_keywords)} keywords for structure...")
         
-        category_keywords = set()  # 2-word combinations (main categories)
-        subcategory_keywords = set()  # 3+ word combinations (subcategories)
-        base_lower = self.base_keyword.lower()
-        
-        for keyword in all_keywords:
-            words = keyword.strip().split()
-            if len(words) < 2:
-                continue
-            
-            # Skip if keyword doesn't start with base keyword
-            if not keyword.lower().startswith(base_lower):
-                continue
-            
-            # Remove base keyword to count additional words
-            remaining_words = keyword[len(base_lower):].strip().split()
+        if set(all_keywords) == self.all_keywords:
+            # Keywords from this scrape were already classified and sorted as they arrived
+            category_keywords = self.category_keywords
+            subcategory_keywords = self.subcategory_keywords
+        else:
+            category_keywords = set()  # 2-word combinations (main categories)
+            subcategory_keywords = set()  # 3+ word combinations (subcategories)
             
-            # Category: exactly 1 additional word (e.g., "patinete electrico joyor")
-            if len(remaining_words) == 1:
-                category_keywords.add(keyword)
+            for keyword in all_keywords:
+                keyword_type = self.classify_keyword(keyword)
+                if keyword_type == 'category':
+                    category_keywords.add(keyword)
+                elif keyword_type == 'subcategory':
+                    subcategory_keywords.add(keyword)
             
-            # Subcategory: 2+ additional words (e.g., "patinete electrico joyor acelerador")
-            elif len(remaining_words) >= 2:
-                subcategory_keywords.add(keyword)
+            category_keywords = sorted(category_keywords)
+            subcategory_keywords = sorted(subcategory_keywords)
         
         safe_print(f"[STRUCTURE] Found {len(category_keywords)} category keywords (2-word combinations)")
         safe_print(f"[STRUCTURE] Found {len(subcategory_keywords)} subcategory keywords (3+ word combinations)")
         
-        return sorted(category_keywords), sorted(subcategory_keywords)
+        return list(category_keywords), list(subcategory_keywords)
     
     def cleanup_old_files(self, output_dir="data"):
         """Delete old keyword files before creating new ones"""
@@ -650,7 +803,8 @@ class AdvancedAmazonKeywordScraper:
             "keywords.txt",
             "category_keywords.txt", 
             "subcategory_keywords.txt",
-            "keyword_structure.json"
+            "keyword_structure.json",
+            "keyword_structure.json.gz"
         ]
         
         safe_print(f"[CLEANUP] Deleting old files...")
@@ -662,10 +816,9 @@ class AdvancedAmazonKeywordScraper:
         
         safe_print(f"[CLEANUP] Cleanup completed!")
 
-    def save_structured_keywords(self, all_keywords, output_dir="data"):
-        """Save keywords in structured format for AI mapper"""
+    def save_structured_keywords(self, all_keywords, output_dir="data", compress=False):
+        """Save keywords in structured format for AI mapper (structure JSON gzipped if compress)"""
         import os
-        import json
         
         # Clean up old files first
         self.cleanup_old_files(output_dir)
@@ -675,25 +828,16 @@ class AdvancedAmazonKeywordScraper:
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Save all keywords (for backward compatibility)
-        keywords_file = os.path.join(output_dir, "keywords.txt")
-        with open(keywords_file, 'w', encoding='utf-8') as f:
-            for keyword in sorted(all_keywords):
-                f.write(f"{keyword}\n")
+        # Save all keywords (for backward compatibility); the structure lists are already sorted
+        keywords_file = self.write_keywords_file(os.path.join(output_dir, "keywords.txt"), sorted(all_keywords))
         safe_print(f"[SAVE] All keywords saved to: {keywords_file}")
         
         # Save category keywords (2-word combinations)
-        categories_file = os.path.join(output_dir, "category_keywords.txt")
-        with open(categories_file, 'w', encoding='utf-8') as f:
-            for keyword in sorted(category_keywords):
-                f.write(f"{keyword}\n")
+        categories_file = self.write_keywords_file(os.path.join(output_dir, "category_keywords.txt"), category_keywords)
         safe_print(f"[SAVE] Category keywords saved to: {categories_file}")
         
         # Save subcategory keywords (3+ word combinations)  
-        subcategories_file = os.path.join(output_dir, "subcategory_keywords.txt")
-        with open(subcategories_file, 'w', encoding='utf-8') as f:
-            for keyword in sorted(subcategory_keywords):
-                f.write(f"{keyword}\n")
+        subcategories_file = self.write_keywords_file(os.path.join(output_dir, "subcategory_keywords.txt"), subcategory_keywords)
         safe_print(f"[SAVE] Subcategory keywords saved to: {subcategories_file}")
         
         # Save structured summary
@@ -703,17 +847,23 @@ class AdvancedAmazonKeywordScraper:
             "total_keywords": len(all_keywords),
             "category_keywords": len(category_keywords),
             "subcategory_keywords": len(subcategory_keywords),
-            "categories": sorted(category_keywords),
-            "subcategories": sorted(subcategory_keywords)
+            "categories": category_keywords,
+            "subcategories": subcategory_keywords
         }
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(structure_data, f, indent=2, ensure_ascii=False)
+        if compress:
+            summary_file += ".gz"
+            with gzip.open(summary_file, 'wb', compresslevel=6) as f:
+                f.write(json_dumps(structure_data, indent=True))
+        else:
+            with open(summary_file, 'wb') as f:
+                f.write(json_dumps(structure_data, indent=True))
         safe_print(f"[SAVE] Keyword structure saved to: {summary_file}")
         
         return structure_data
 
-if __name__ == "__main__":
+def main():
+    """Command-line entry point"""
     import argparse
     
     parser = argparse.ArgumentParser(description="Advanced Amazon autocomplete keyword scraper")
@@ -728,6 +878,10 @@ if __name__ == "__main__":
     parser.add_argument('--concurrent', '-c', type=int, default=8,
                        help='Max concurrent requests for async mode (default: 8)')
     parser.add_argument('--suffix', default='', help='Suffix for output files')
+    parser.add_argument('--compress', action='store_true',
+                       help='Write keyword_structure.json gzipped (.json.gz)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not update the 24h suggestion cache')
     args = parser.parse_args()
     
     safe_print(f"[START] Advanced Amazon Keyword Scraper v2.0")
@@ -740,7 +894,7 @@ if __name__ == "__main__":
     elif args.mode == 'fast':
         safe_print(f"[TARGET] Concurrent: {args.concurrent}")
     
-    scraper = AdvancedAmazonKeywordScraper(args.keyword, args.market)
+    scraper = AdvancedAmazonKeywordScraper(args.keyword, args.market, use_cache=not args.no_cache)
     
     # Display market info
     safe_print(f"[OK] Market: {scraper.config['name']} ({scraper.config['amazon_tld']})")
@@ -763,7 +917,7 @@ if __name__ == "__main__":
         # Save structured keywords for AI mapper
         safe_print(f"\n[SAVE] Saving results...")
         output_dir = "data" if not args.suffix else args.suffix
-        structure_data = scraper.save_structured_keywords(keywords, output_dir)
+        structure_data = scraper.save_structured_keywords(keywords, output_dir, compress=args.compress)
         
         safe_print(f"\n[SUCCESS] Scraping completed! Found {len(keywords)} unique keywords.")
         safe_print(f"�� Category Keywords: {structure_data['category_keywords']}")
@@ -771,4 +925,7 @@ if __name__ == "__main__":
         safe_print(f"💾 Files saved to: {args.suffix}/")
         
     else:
-        safe_print("[ERROR] No keywords found! Check your network connection and market settings.") 
\ No newline at end of file
+        safe_print("[ERROR] No keywords found! Check your network connection and market settings.")
+
+if __name__ == "__main__":
+    main()
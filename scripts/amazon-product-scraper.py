@@ -5,6 +5,7 @@ Uses advanced techniques for reliable product scraping with parallel processing
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import time
 import random
@@ -12,11 +13,36 @@ import re
 from urllib.parse import urljoin
 import json
 import os
+import functools
+import importlib.util
+import itertools
 import concurrent.futures
 import threading
 import sys
+from collections import Counter, OrderedDict
 from datetime import datetime
 
+# orjson encodes and decodes the progress and cache files several times faster when installed
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(data, indent=False):
+        """Serialize data to UTF-8 JSON bytes"""
+        # Stringify int dict keys (categoryId) like the stdlib encoder does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(data, indent=False):
+        """Serialize data to UTF-8 JSON bytes"""
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 # Set cache directory to data folder
 os.environ['PYTHONPYCACHEPREFIX'] = os.path.join(os.getcwd(), 'data', '__pycache__')
 
@@ -28,35 +54,322 @@ if sys.platform == "win32":
     except:
         pass
 
+# Parse pages with the C-backed lxml tree builder when it is installed
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Amazon serves its pages as UTF-8; declaring it skips BeautifulSoup's charset sniffing
+PAGE_ENCODING = 'utf-8'
+
+# Only advertise brotli when requests has a decoder for it
+if any(importlib.util.find_spec(module) for module in ('brotli', 'brotlicffi')):
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+else:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Patterns used for every search-result container, compiled once at import time
+ASIN_PATTERN = re.compile(r'^[A-Z0-9]{10}$')
+DP_ASIN_PATTERN = re.compile(r'/dp/([A-Z0-9]{10})')
+RESULT_ITEM_CLASS_PATTERN = re.compile(r's-result-item')
+SPONSORED_PATTERN = re.compile(r'Sponsorisé|Sponsored|Gesponsert', re.I)
+TITLE_TEXT_PATTERN = re.compile(r'.{10,}')
+LEADING_PRICE_PATTERN = re.compile(r'^\d+[,\.]\d*')
+LEADING_INTEGER_PATTERN = re.compile(r'^\d+$')
+DECIMAL_NUMBER_PATTERN = re.compile(r'(\d+[,\.]\d*)')
+# Amount followed or preceded by a euro marker, in a single pass
+PRICE_TEXT_PATTERN = re.compile(r'(\d+[,\.]\d*)\s*(?:€|EUR|euros)|(?:€|EUR|euros)\s*(\d+[,\.]\d*)')
+STAR_RATING_CLASS_PATTERN = re.compile(r'star|rating')
+RATING_TEXT_PATTERN = re.compile(r'(\d+[,\.]\d*)\s*(?:de|out\s*of|/)\s*5')
+REVIEW_COUNT_PATTERN = re.compile(r'\((\d+(?:\s?\d+)*)\)')
+# Explicit ASIN markers in one scan; a bare 10-character path segment is only a fallback
+ASIN_URL_PATTERN = re.compile(r'(?:/dp/|/product/|asin=)([A-Z0-9]{10})')
+ASIN_PATH_SEGMENT_PATTERN = re.compile(r'/([A-Z0-9]{10})/')
+DP_LINK_SELECTOR = 'a[href*="/dp/"]'
+H2_LINK_SELECTOR = 'h2 a[href]'
+# Feature bullets, section headings and the byline, collected in one tree walk
+DETAIL_NODES_SELECTOR = 'div#feature-bullets span.a-list-item, h2, h3, a#bylineInfo'
+
+# Patterns run over whole product detail pages
+# All media keys in one scan, returned as (key, url) pairs
+MEDIA_URL_PATTERN = re.compile(r'"(hiRes|large|main|videoUrl)":"([^"]+)"')
+# Amazon image size tokens (._SL75_, ._AC_SL300_, ...) upgraded to 1500px
+IMAGE_SIZE_PATTERN = re.compile(r'\._(AC_)?SL(?:75|160|300|500)_')
+# Anchor only; the array itself is parsed by CAROUSEL_DECODER from where the match ends
+CAROUSEL_PATTERN = re.compile(r'"colorImages":\s*{\s*"initial":\s*(?=\[)')
+CAROUSEL_DECODER = json.JSONDecoder()
+ABOUT_SECTION_PATTERN = re.compile(r'À propos|About|Caractéristiques', re.I)
+
+# Slug and statistics patterns
+SLUG_ACCENT_TABLE = str.maketrans('áàäâãéèëêíìïîóòöôõúùüûñç', 'aaaaaeeeeiiiiooooouuuunc')
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+SLUG_DASH_PATTERN = re.compile(r'[-\s]+')
+STATS_PRICE_PATTERN = re.compile(r'(\d+[,.]?\d*)')
+
+# Generic brands for various product categories, matched in this order against titles
+BRANDS = (
+    'Samsung', 'Apple', 'iPhone', 'Xiaomi', 'Huawei', 'Nokia', 'Oppo', 'Realme',
+    'OnePlus', 'Motorola', 'LG', 'Sony', 'Google', 'Pixel', 'Honor', 'Vivo',
+    'Alcatel', 'TCL', 'Blackview', 'Doogee', 'Ulefone', 'Cubot', 'Oukitel',
+    'Cat', 'Caterpillar', 'Gigaset', 'Panasonic', 'Philips', 'Siemens',
+    'Ninja', 'SEB', 'Moulinex', 'Tefal', 'Delonghi', 'Cosori', 'Cecotec',
+    'Bosch', 'KitchenAid', 'Kenwood', 'Braun', 'Dyson', 'Shark', 'iRobot',
+    'JBL', 'Bose', 'Sennheiser', 'Audio-Technica', 'Marshall',
+    'Nike', 'Adidas', 'Puma', 'Reebok', 'Under Armour', 'New Balance'
+)
+BRANDS_UPPER = tuple((brand, brand.upper()) for brand in BRANDS)
+
+# Shared request budget for every worker thread: about 20 requests per 30s, independent of
+# the worker count, with a small burst so a fresh page of results does not wait on its first fetches
+REQUEST_RATE = 20 / 30
+REQUEST_BURST = 3
+
+# Cached search and product pages are reused across runs for a day
+PAGE_CACHE_TTL = 86400
+# Completed categories between page cache writes (the cache is also written at exit)
+PAGE_CACHE_SAVE_INTERVAL = 10
+
+# Unicode replacements for Windows consoles, compiled once at import time
+SAFE_PRINT_REPLACEMENTS = {
+    '✅': '[OK]',
+    '❌': '[ERROR]',
+    '⚠️': '[WARNING]',
+    '🔄': '[RETRY]',
+    '🔍': '[SEARCH]',
+    '📊': '[STATS]',
+    '🎯': '[TARGET]',
+    '💾': '[SAVE]',
+    '🚀': '[START]',
+    '🏷️': '[CATEGORY]',
+    '📄': '[PAGE]',
+    '⭐': '[RATING]',
+    '💰': '[PRICE]',
+    '🎉': '[SUCCESS]'
+}
+SAFE_PRINT_PATTERN = re.compile('|'.join(map(re.escape, SAFE_PRINT_REPLACEMENTS)))
+
 def safe_print(message):
     """Print message with Unicode characters replaced for Windows compatibility"""
-    if sys.platform == "win32":
-        replacements = {
-            '✅': '[OK]',
-            '❌': '[ERROR]',
-            '⚠️': '[WARNING]',
-            '🔄': '[RETRY]',
-            '🔍': '[SEARCH]',
-            '📊': '[STATS]',
-            '🎯': '[TARGET]',
-            '💾': '[SAVE]',
-            '🚀': '[START]',
-            '🏷️': '[CATEGORY]',
-            '📄': '[PAGE]',
-            '⭐': '[RATING]',
-            '💰': '[PRICE]',
-            '🎉': '[SUCCESS]'
-        }
-        for unicode_char, replacement in replacements.items():
-            message = message.replace(unicode_char, replacement)
+    if sys.platform == "win32" and not message.isascii():
+        message = SAFE_PRINT_PATTERN.sub(lambda match: SAFE_PRINT_REPLACEMENTS[match.group(0)], message)
     print(message)
 
+COUNTRY_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'country-config.json')
+
+@functools.lru_cache(maxsize=1)
+def load_country_config_file():
+    """Read and parse config/country-config.json once per process"""
+    with open(COUNTRY_CONFIG_PATH, 'rb') as f:
+        return json_loads(f.read())
+
+# Variant listings repeat the same titles, so brand lookups are memoized per title
+@functools.lru_cache(maxsize=4096)
+def extract_brand(title):
+    """Return the first BRANDS entry found in the title, else its first word"""
+    title_upper = title.upper()
+    # A brand can only match if its first letter occurs in the title; the set lookup
+    # skips most substring scans while keeping BRANDS order
+    title_letters = set(title_upper)
+    for brand, brand_upper in BRANDS_UPPER:
+        if brand_upper[0] in title_letters and brand_upper in title_upper:
+            return brand
+    
+    # Fallback: first word
+    words = title.split()
+    return words[0] if words else "Unknown"
+
+# Listings of the same item repeat titles, so slugs are memoized per title
+@functools.lru_cache(maxsize=4096)
+def slugify(title):
+    """Lowercase, strip accents and punctuation, and dash-join a title (max 50 chars)"""
+    # Convert accented characters to their non-accented equivalents in one C-level pass
+    slug = title.lower().translate(SLUG_ACCENT_TABLE)
+    slug = SLUG_STRIP_PATTERN.sub('', slug)
+    slug = SLUG_DASH_PATTERN.sub('-', slug)
+    return slug.strip('-')[:50]
+
+def copy_products(data):
+    """Shallow-copy a product dict or a list of them, so cached entries are never shared with callers"""
+    if isinstance(data, list):
+        return [dict(product) for product in data]
+    return dict(data)
+
+class TokenBucketLimiter:
+    """Token bucket that lets bursts through and only blocks once the request budget is spent"""
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self):
+        """Take one token and return how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire(self):
+        """Block the current thread until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+# Placeholder star breakdown shared by every site product (serialized, never mutated)
+REVIEW_BREAKDOWN = {"5": 60, "4": 25, "3": 10, "2": 3, "1": 2}
+
+# Static stylesheet for the product preview pages
+PREVIEW_STYLES = """
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .product-container {
+            background: white;
+            border-radius: 8px;
+            padding: 30px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .header {
+            background: #232f3e;
+            color: white;
+            padding: 20px;
+            margin: -30px -30px 30px -30px;
+            border-radius: 8px 8px 0 0;
+        }
+        .category-badge {
+            background: #ff9900;
+            color: black;
+            padding: 5px 10px;
+            border-radius: 4px;
+            font-size: 12px;
+            font-weight: bold;
+        }
+        .product-title {
+            font-size: 24px;
+            font-weight: bold;
+            margin: 20px 0;
+            color: #0066cc;
+        }
+        .product-meta {
+            display: flex;
+            gap: 30px;
+            margin: 20px 0;
+        }
+        .meta-item {
+            text-align: center;
+        }
+        .meta-label {
+            font-size: 12px;
+            color: #666;
+            text-transform: uppercase;
+        }
+        .meta-value {
+            font-size: 18px;
+            font-weight: bold;
+            color: #333;
+        }
+        .price {
+            color: #B12704;
+            font-size: 24px;
+        }
+        .rating {
+            color: #ff9900;
+        }
+        .images-section {
+            margin: 30px 0;
+        }
+        .images-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin-top: 15px;
+        }
+        .image-item {
+            text-align: center;
+        }
+        .image-item img {
+            max-width: 100%;
+            height: 200px;
+            object-fit: contain;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            padding: 10px;
+            background: white;
+        }
+        .description-section {
+            margin: 30px 0;
+        }
+        .features-list {
+            list-style: none;
+            padding: 0;
+        }
+        .features-list li {
+            padding: 8px 0;
+            border-bottom: 1px solid #eee;
+        }
+        .features-list li:before {
+            content: "✓";
+            color: #00a652;
+            font-weight: bold;
+            margin-right: 10px;
+        }
+        .affiliate-section {
+            background: #e7f3ff;
+            border: 2px solid #0066cc;
+            border-radius: 8px;
+            padding: 20px;
+            margin: 30px 0;
+            text-align: center;
+        }
+        .affiliate-button {
+            background: #ff9900;
+            color: white;
+            padding: 15px 30px;
+            border: none;
+            border-radius: 4px;
+            font-size: 16px;
+            font-weight: bold;
+            text-decoration: none;
+            display: inline-block;
+            margin: 10px;
+        }
+        .affiliate-button:hover {
+            background: #e68900;
+        }
+        .tech-details {
+            background: #f8f8f8;
+            border-radius: 4px;
+            padding: 15px;
+            margin: 20px 0;
+        }
+        .asin {
+            font-family: monospace;
+            background: #f0f0f0;
+            padding: 2px 6px;
+            border-radius: 3px;
+        }
+"""
+
 class AmazonScraper:
-    def __init__(self, market='fr'):
+    def __init__(self, market='fr', use_cache=True):
         # Load market configuration
         self.market = market
         self.config = self.load_market_config(market)
         
+        # Per-market request constants, built once instead of on every request
+        self.domain = self.config.get('amazon_domain', f"amazon{self.config['amazon_tld']}")
+        self.base_url = f"https://{self.domain}"
+        self.search_url_template = f"{self.base_url}/s?k={{keyword}}&page={{page}}&ref=sr_pg_{{page}}"
+        self.language_header = self.get_language_header()
+        self.affiliate_tag = self.config['affiliate_tag']
+        self.currency = self.config['currency']
+        self.market_name = self.config['name']
+        
         # Ultra-optimized parallel processing settings for maximum performance
         self.max_workers = 16  # Increased from 12 to 16 for maximum throughput
         
@@ -69,9 +382,9 @@ class AmazonScraper:
         self.min_price = 0     # No minimum price filter - get prices from product pages
         
         # Track unique products (thread-safe)
-        self.used_asins = set()
+        # ASINs are sharded over several locks so extraction threads rarely contend
+        self.asin_shards = [(set(), threading.Lock()) for _ in range(16)]
         self.used_urls = set()
-        self.asins_lock = threading.Lock()
         
         # Results storage
         self.all_products = {}
@@ -80,16 +393,44 @@ class AmazonScraper:
         self.products_saved_count = 0
         self.products_saved_lock = threading.Lock()
         
-        # Cache system for better performance
-        self.product_cache = {}
-        self.search_cache = {}
+        # Product files go to data/products at the repo root; resolve and create it once
+        if os.path.basename(os.getcwd()) == 'scripts':
+            self.products_dir = os.path.join('..', 'data', 'products')
+        else:
+            self.products_dir = os.path.join('data', 'products')
+        os.makedirs(self.products_dir, exist_ok=True)
+        
+        # Cache system for better performance (LRU, most recently used at the end)
+        self.product_cache = OrderedDict()
+        self.search_cache = OrderedDict()
+        self.cache_limits = {'product': 3000, 'search': 1500}
         self.cache_lock = threading.Lock()
         self.cache_hits = 0
         self.cache_misses = 0
+        # Serializes page cache writes, which share one temp file, and counts skipped saves
+        self.cache_save_lock = threading.Lock()
+        self.cache_saves_pending = 0
+        
+        # On-disk copy of the caches so restarts do not re-fetch the same pages
+        self.use_cache = use_cache
+        self.cache_file = f"data/page_cache_{self.market}.json"
+        if use_cache:
+            self.load_page_cache()
+        
+        # Long-lived worker pools shared by every batch instead of one pool per batch/page.
+        # The search pool also caps concurrent search page fetches across all category
+        # threads (8 matches the category batch size, the previous effective limit)
+        self.category_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='category')
+        self.product_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='product')
+        self.search_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='search')
+        self.save_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='save')
         
         # Rate limiting delays - ULTRA OPTIMIZED FOR MAXIMUM SPEED
         self.current_delay = (0.3, 1.0)  # Further reduced delays for maximum performance
         
+        # Shared request budget for all worker threads (see REQUEST_RATE)
+        self.rate_limiter = TokenBucketLimiter(REQUEST_RATE, capacity=REQUEST_BURST)
+        
         
         # Simple rate limiting tracking
         self.consecutive_503_errors = 0
@@ -131,19 +472,35 @@ class AmazonScraper:
             'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
             'Mozilla/5.0 (Linux; Android 14; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36'
         ]
-        
+        # Each thread cycles through its own shuffled copy of the user agents
+        self.user_agent_local = threading.local()
+        
+    def close(self):
+        """Shut down the shared worker pools and write the page cache one last time"""
+        for pool in (self.category_pool, self.product_pool, self.search_pool, self.save_pool):
+            pool.shutdown(wait=True)
+        self.save_page_cache()
+    
     def setup_advanced_session(self):
         """Setup session with advanced stealth features"""
         session = requests.Session()
         
-        # Advanced headers with proper language for current market
-        language_header = self.get_language_header()
+        # Size the pool for the category and product worker threads so keep-alive
+        # connections are reused instead of discarded; retries live in make_request
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(32, self.max_workers * 4), max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         
+        self.apply_session_identity(session)
+        return session
+    
+    def apply_session_identity(self, session):
+        """Apply a fresh browser fingerprint (headers and cookies) to a session"""
         # Start with a realistic browser-like base
         session.headers.update({
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': language_header,
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Language': self.language_header,
+            'Accept-Encoding': ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -159,6 +516,7 @@ class AmazonScraper:
         
         # Add realistic cookies for current market
         market_cookies = self.get_market_cookies()
+        session.cookies.clear()
         session.cookies.update(market_cookies)
         
         # Add additional realistic cookies like the working scraper
@@ -168,23 +526,17 @@ class AmazonScraper:
             'i18n-prefs': 'EUR',
             'sp-cdn': f'L5Z9:{self.market.upper()}',
         })
-        
-        return session
     
     def rotate_session(self):
         """Rotate browser session to avoid detection"""
         with self.session_rotation_lock:
             safe_print(f"  [ROTATION] Rotating browser session...")
             
-            # Close current session
-            if hasattr(self.session, 'close'):
-                self.session.close()
-            
-            # Wait a bit before creating new session
+            # Wait a bit before switching identity
             time.sleep(random.uniform(2, 5))
             
-            # Create new session with different fingerprint
-            self.session = self.setup_advanced_session()
+            # Swap fingerprint on the live session so pooled connections are kept
+            self.apply_session_identity(self.session)
             
             # Reset request counter
             self.request_count = 0
@@ -193,7 +545,7 @@ class AmazonScraper:
             self.consecutive_503_errors = 0
             self.last_rotation_time = time.time()
             
-            safe_print(f"  [ROTATION] New session created")
+            safe_print(f"  [ROTATION] Session identity refreshed")
     
     def should_rotate_session(self):
         """Check if session should be rotated"""
@@ -248,7 +600,7 @@ class AmazonScraper:
         return {
             'session-id': session_id,
             f'ubid-{ubid_suffix}': f'262-{random.randint(1000000, 9999999)}-{random.randint(1000000, 9999999)}',
-            'i18n-prefs': self.config['currency'],
+            'i18n-prefs': self.currency,
             f'lc-{ubid_suffix}': locale_map.get(self.market, 'es_ES'),
             'sp-cdn': f'L5Z9:{country_code}',
         }
@@ -259,44 +611,90 @@ class AmazonScraper:
     
     def get_cached_data(self, cache_key):
         """Get data from cache"""
+        now = time.time()
         with self.cache_lock:
-            if cache_key in self.product_cache:
-                self.cache_hits += 1
-                return self.product_cache[cache_key]
-            elif cache_key in self.search_cache:
+            for cache in (self.product_cache, self.search_cache):
+                entry = cache.get(cache_key)
+                if entry is None:
+                    continue
+                if now - entry['timestamp'] >= PAGE_CACHE_TTL:
+                    del cache[cache_key]
+                    break
+                cache.move_to_end(cache_key)
                 self.cache_hits += 1
-                return self.search_cache[cache_key]
-            else:
-                self.cache_misses += 1
-                return None
+                # Callers tag products with their category in place; hand out a copy
+                return copy_products(entry['data'])
+            self.cache_misses += 1
+            return None
     
     def cache_data(self, cache_key, data, cache_type='product'):
         """Cache data with thread safety"""
+        if cache_type == 'product':
+            cache = self.product_cache
+        elif cache_type == 'search':
+            cache = self.search_cache
+        else:
+            return
+        
+        # Store a copy so later in-place edits of the caller's products don't leak into the cache
+        data = copy_products(data)
         with self.cache_lock:
-            if cache_type == 'product':
-                self.product_cache[cache_key] = data
-            elif cache_type == 'search':
-                self.search_cache[cache_key] = data
-            
-            # Limit cache size to prevent memory issues - ULTRA OPTIMIZED FOR MAXIMUM PERFORMANCE
-            if len(self.product_cache) > 3000:  # Increased from 2000
-                # Remove oldest entries
-                oldest_keys = list(self.product_cache.keys())[:300]  # Increased from 200
-                for key in oldest_keys:
-                    del self.product_cache[key]
-            
-            if len(self.search_cache) > 1500:  # Increased from 1000
-                # Remove oldest entries
-                oldest_keys = list(self.search_cache.keys())[:150]  # Increased from 100
-                for key in oldest_keys:
-                    del self.search_cache[key]
+            cache[cache_key] = {'timestamp': time.time(), 'data': data}
+            cache.move_to_end(cache_key)
+            
+            # Limit cache size to prevent memory issues by evicting least recently used entries
+            while len(cache) > self.cache_limits[cache_type]:
+                cache.popitem(last=False)
+    
+    def load_page_cache(self):
+        """Load unexpired search and product pages cached by a previous run"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'rb') as f:
+                    cache_data = json_loads(f.read())
+                now = time.time()
+                for cache_type, cache in (('product', self.product_cache), ('search', self.search_cache)):
+                    entries = sorted(cache_data.get(cache_type, {}).items(), key=lambda item: item[1]['timestamp'])
+                    for key, entry in entries[-self.cache_limits[cache_type]:]:
+                        if now - entry['timestamp'] < PAGE_CACHE_TTL:
+                            cache[key] = entry
+                safe_print(f"[CACHE] Loaded {len(self.product_cache)} product and {len(self.search_cache)} search pages from {self.cache_file}")
+        except Exception as e:
+            safe_print(f"[WARNING] Could not load page cache: {e}")
+    
+    def save_page_cache(self, force=True):
+        """Save unexpired search and product pages to file, unless forced only every PAGE_CACHE_SAVE_INTERVAL calls"""
+        if not self.use_cache:
+            return
+        with self.cache_save_lock:
+            self.cache_saves_pending += 1
+            if not force and self.cache_saves_pending < PAGE_CACHE_SAVE_INTERVAL:
+                return
+            self.cache_saves_pending = 0
+            
+            try:
+                now = time.time()
+                with self.cache_lock:
+                    cache_data = {
+                        cache_type: {key: entry for key, entry in cache.items()
+                                     if now - entry['timestamp'] < PAGE_CACHE_TTL}
+                        for cache_type, cache in (('product', self.product_cache), ('search', self.search_cache))
+                    }
+                os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+                temp_file = f"{self.cache_file}.tmp"
+                with open(temp_file, 'wb') as f:
+                    f.write(json_dumps(cache_data))
+                os.replace(temp_file, self.cache_file)
+                safe_print(f"[CACHE] Saved {len(cache_data['product'])} product and {len(cache_data['search'])} search pages to {self.cache_file}")
+            except Exception as e:
+                safe_print(f"[WARNING] Could not save page cache: {e}")
     
     def load_progress(self):
         """Load scraping progress from file"""
         try:
             if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    progress_data = json.load(f)
+                with open(self.progress_file, 'rb') as f:
+                    progress_data = json_loads(f.read())
                     self.completed_categories = set(progress_data.get('completed_categories', []))
                     safe_print(f"[PROGRESS] Loaded progress: {len(self.completed_categories)} categories completed")
             else:
@@ -314,8 +712,8 @@ class AmazonScraper:
                 'market': self.market,
                 'total_products_saved': self.products_saved_count
             }
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress_data, f, indent=2, ensure_ascii=False)
+            with open(self.progress_file, 'wb') as f:
+                f.write(json_dumps(progress_data, indent=True))
             safe_print(f"[PROGRESS] Saved progress: {len(self.completed_categories)} categories completed")
         except Exception as e:
             safe_print(f"[WARNING] Could not save progress: {e}")
@@ -338,11 +736,16 @@ class AmazonScraper:
     
     def get_random_headers(self):
         """Get randomized headers for each request"""
+        user_agent_cycle = getattr(self.user_agent_local, 'cycle', None)
+        if user_agent_cycle is None:
+            user_agent_cycle = itertools.cycle(random.sample(self.user_agents, len(self.user_agents)))
+            self.user_agent_local.cycle = user_agent_cycle
+        
         headers = {
-            'User-Agent': random.choice(self.user_agents),
+            'User-Agent': next(user_agent_cycle),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': self.get_language_header(),
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Language': self.language_header,
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0',
@@ -358,29 +761,24 @@ class AmazonScraper:
     
     def make_request(self, url, retries=2):
         """Make HTTP request with adaptive retry logic and CAPTCHA detection"""
-        # Global delay before any request - ULTRA OPTIMIZED FOR MAXIMUM SPEED
-        global_delay = random.uniform(0.5, 2)  # Further reduced from 1-3s
-        safe_print(f"  [GLOBAL] Pre-request delay: {global_delay:.1f}s")
-        time.sleep(global_delay)
-        
         for attempt in range(retries):
             try:
                 # Check if we need to rotate session
                 if self.should_rotate_session():
                     self.rotate_session()
                 
-                # Adaptive delays based on attempt number - ULTRA OPTIMIZED FOR MAXIMUM SPEED
                 if attempt == 0:
-                    delay = random.uniform(2, 5)  # Further reduced delay for first attempt
+                    # First attempts only wait when the shared request budget is spent
+                    self.rate_limiter.acquire()
+                    
+                    # Simulate human behavior
+                    self.simulate_human_behavior()
                 else:
                     # Minimal delays for retries while staying safe
                     delay = random.uniform(5, 10) + (attempt * 3)
-                
-                safe_print(f"  [DELAY] Attempt {attempt + 1}/{retries}: Waiting {delay:.1f}s before request...")
-                time.sleep(delay)
-                
-                # Simulate human behavior
-                self.simulate_human_behavior()
+                    safe_print(f"  [DELAY] Attempt {attempt + 1}/{retries}: Waiting {delay:.1f}s before request...")
+                    time.sleep(delay)
+                    self.rate_limiter.acquire()
                 
                 # Use random headers for this request
                 headers = self.get_random_headers()
@@ -471,8 +869,8 @@ class AmazonScraper:
         """Load hierarchical category structure from data/categories.json"""
         try:
             categories_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'categories.json')
-            with open(categories_path, 'r', encoding='utf-8') as f:
-                categories_data = json.load(f)
+            with open(categories_path, 'rb') as f:
+                categories_data = json_loads(f.read())
             
             # Transform hierarchical structure to flat list for scraping
             categories = []
@@ -523,57 +921,109 @@ class AmazonScraper:
     def search_products(self, keyword, page=1, fallback_mode=False):
         """Search for products with advanced filtering and smart fallback"""
         # Check cache first
+        cache_key, cached_result = self.get_cached_search(keyword, page, fallback_mode)
+        if cached_result:
+            return cached_result
+        
+        response = self.fetch_search_page(keyword, page)
+        return self.parse_search_results(response, cache_key)
+    
+    def get_cached_search(self, keyword, page, fallback_mode=False):
+        """Return the cache key for a search page and its cached products, if any"""
         cache_key = self.get_cache_key('search', f"{keyword}_{page}_{fallback_mode}")
         cached_result = self.get_cached_data(cache_key)
         if cached_result:
             safe_print(f"[CACHE] Using cached search results for '{keyword}' page {page}")
-            return cached_result
-        
+        return cache_key, cached_result
+    
+    def fetch_search_page(self, keyword, page):
+        """Download one search results page"""
         # Build search URL without price filter using the domain from config
-        domain = self.config.get('amazon_domain', f"amazon{self.config['amazon_tld']}")
-            
-        search_url = f"https://{domain}/s?k={keyword.replace(' ', '+')}&page={page}&ref=sr_pg_{page}"
+        search_url = self.search_url_template.format(keyword=keyword.replace(' ', '+'), page=page)
         
         safe_print(f"[SEARCH] Page {page}: {search_url}")
         
-        response = self.make_request(search_url, retries=2)
+        return self.make_request(search_url, retries=2)
+    
+    def parse_search_results(self, response, cache_key):
+        """Extract and cache the products of a downloaded search results page"""
         if not response:
             safe_print("[ERROR] Failed to get search results")
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding=PAGE_ENCODING)
         
         # Find product containers with multiple selectors
         containers = soup.find_all('div', {'data-component-type': 's-search-result'})
         if not containers:
-            containers = soup.find_all('div', class_=re.compile(r's-result-item'))
+            containers = soup.find_all('div', class_=RESULT_ITEM_CLASS_PATTERN)
         if not containers:
-            containers = soup.find_all('div', attrs={'data-asin': re.compile(r'^[A-Z0-9]{10}$')})
+            containers = soup.find_all('div', attrs={'data-asin': ASIN_PATTERN})
         
         safe_print(f"[OK] Found {len(containers)} product containers")
         
+        # One timestamp for every product on the page; they are all scraped from the same response
+        scraped_at = datetime.now().isoformat()
         products = []
+        page_asins = set()
         for container in containers:
-            product = self.extract_product_info(container)
-            if product:
+            product = self.extract_product_info(container, scraped_at)
+            # Drop repeats of an ASIN within the page; ASINs are claimed only once a category keeps the product
+            if product and product['asin'] not in page_asins:
+                page_asins.add(product['asin'])
                 products.append(product)
                 title_short = product['title'][:40] + "..." if len(product['title']) > 40 else product['title']
                 safe_print(f"[OK] Product {len(products)}: {title_short}")
         
+        # Break the tree's parent/child cycles so the page is freed now, not at the next GC
+        soup.decompose()
+        
         # Cache the results
         self.cache_data(cache_key, products, 'search')
         
         return products
     
-    def extract_product_info(self, container):
+    def search_products_pages(self, keyword, pages=range(1, 5), fallback_mode=False):
+        """Yield (page, products) in page order: the first page alone, the rest concurrently if the caller keeps iterating"""
+        pages = list(pages)
+        yield from self.fetch_search_pages(keyword, pages[:1], fallback_mode)
+        yield from self.fetch_search_pages(keyword, pages[1:], fallback_mode)
+    
+    def fetch_search_pages(self, keyword, pages, fallback_mode=False):
+        """Fetch several search result pages concurrently and return their products in page order"""
+        results = {}
+        pending = {}
+        for page in pages:
+            cache_key, cached_result = self.get_cached_search(keyword, page, fallback_mode)
+            if cached_result:
+                results[page] = cached_result
+            else:
+                pending[self.search_pool.submit(self.fetch_search_page, keyword, page)] = (page, cache_key)
+        
+        # Parse each page on this thread as soon as it arrives, while the rest keep downloading
+        for future in concurrent.futures.as_completed(pending):
+            page, cache_key = pending[future]
+            results[page] = self.parse_search_results(future.result(), cache_key)
+        
+        return [(page, results[page]) for page in pages]
+    
+    def extract_product_info(self, container, scraped_at=None):
         """Extract comprehensive product information with improved parsing and quality filtering"""
         try:
-            # Skip sponsored products
-            if container.find('span', string=re.compile(r'Sponsorisé|Sponsored|Gesponsert', re.I)):
+            # Cheap attribute checks first: an empty data-asin marks a layout slot, not a
+            # product, and Amazon tags sponsored results with the AdHolder class
+            if container.get('data-asin') == '' or 'AdHolder' in container.get('class', []):
+                return None
+            
+            # Skip sponsored products not caught above (scans the container's strings)
+            if container.find('span', string=SPONSORED_PATTERN):
                 return None
             
             product = {}
             
+            # Full container text, computed on first use and shared by the fallbacks below
+            all_text = None
+            
             # Extract ASIN with multiple methods
             asin = container.get('data-asin')
             if not asin:
@@ -581,40 +1031,26 @@ class AmazonScraper:
                 asin_attrs = ['data-asin', 'data-item-id', 'id']
                 for attr in asin_attrs:
                     asin = container.get(attr)
-                    if asin and re.match(r'^[A-Z0-9]{10}$', asin):
+                    if asin and ASIN_PATTERN.match(asin):
                         break
                 
                 # Try to extract from links
                 if not asin:
-                    links = container.find_all('a', href=True)
-                    for link in links:
-                        href = link.get('href', '')
-                        asin_match = re.search(r'/dp/([A-Z0-9]{10})', href)
+                    # Only /dp/ links can carry an ASIN, so let the selector filter them
+                    for link in container.select(DP_LINK_SELECTOR):
+                        asin_match = DP_ASIN_PATTERN.search(link['href'])
                         if asin_match:
                             asin = asin_match.group(1)
                             break
             
-            # If still no ASIN, try to extract from the container HTML
-            if not asin:
-                container_html = str(container)
-                asin_match = re.search(r'/dp/([A-Z0-9]{10})', container_html)
-                if asin_match:
-                    asin = asin_match.group(1)
-            
             # If still no ASIN, generate a temporary one for testing
             if not asin:
                 # Create a temporary identifier for products without ASIN
-                temp_id = f"TEMP_{hash(str(container)) % 1000000:06d}"
+                all_text = container.get_text()
+                temp_id = f"TEMP_{hash(all_text) % 1000000:06d}"
                 safe_print(f"  [WARNING] No ASIN found, using temp ID: {temp_id}")
                 asin = temp_id
             
-            # Thread-safe ASIN check (only for real ASINs)
-            if re.match(r'^[A-Z0-9]{10}$', asin):
-                with self.asins_lock:
-                    if asin in self.used_asins:
-                        return None
-                    self.used_asins.add(asin)
-            
             product['asin'] = asin
             
             # Title and URL extraction with improved methods
@@ -622,20 +1058,18 @@ class AmazonScraper:
             link = None
             title_text = ""
             
-            # Method 1: H2 elements with links
-            h2_elements = container.find_all('h2')
-            for h2 in h2_elements:
-                link_elem = h2.find('a')
-                if link_elem and link_elem.get('href'):
+            # Method 1: H2 elements with links (one selector sweep instead of a find per heading)
+            for link_elem in container.select(H2_LINK_SELECTOR):
+                if link_elem.get('href'):
                     title_text = link_elem.get_text().strip()
                     if title_text and len(title_text) > 5:
-                        title_elem = h2
+                        title_elem = link_elem.find_parent('h2')
                         link = link_elem
                         break
             
             # Method 2: Any link with /dp/ in href
             if not title_elem:
-                links = container.find_all('a', href=re.compile(r'/dp/'))
+                links = container.select(DP_LINK_SELECTOR)
                 for potential_link in links:
                     text = potential_link.get_text().strip()
                     if text and len(text) > 5:
@@ -647,23 +1081,24 @@ class AmazonScraper:
             # Method 3: Look for any text that looks like a product title
             if not title_elem:
                 # Try to find spans or divs with product-like text
-                text_elements = container.find_all(['span', 'div', 'h3'], string=re.compile(r'.{10,}'))
+                text_elements = container.find_all(['span', 'div', 'h3'], string=TITLE_TEXT_PATTERN)
                 for elem in text_elements:
                     text = elem.get_text().strip()
-                    if text and len(text) > 10 and not re.match(r'^\d+[,\.]\d*', text):
+                    if text and len(text) > 10 and not LEADING_PRICE_PATTERN.match(text):
                         title_text = text
                         # Find the closest link
-                        link = elem.find_parent().find('a', href=re.compile(r'/dp/'))
+                        link = elem.find_parent().select_one(DP_LINK_SELECTOR)
                         if link:
                             title_elem = elem
                             break
             
             # If still no title, try to extract from any text in the container
             if not title_text:
-                all_text = container.get_text()
+                if all_text is None:
+                    all_text = container.get_text()
                 lines = [line.strip() for line in all_text.split('\n') if line.strip()]
                 for line in lines:
-                    if len(line) > 10 and not re.match(r'^\d+[,\.]\d*', line) and not re.match(r'^\d+$', line):
+                    if len(line) > 10 and not LEADING_PRICE_PATTERN.match(line) and not LEADING_INTEGER_PATTERN.match(line):
                         title_text = line
                         break
             
@@ -676,15 +1111,30 @@ class AmazonScraper:
             # URL extraction
             if link and link.get('href'):
                 href = link.get('href')
-                domain = self.config.get('amazon_domain', f"amazon{self.config['amazon_tld']}")
                 if href.startswith('/'):
-                    product['url'] = f"https://{domain}{href}"
+                    product['url'] = f"{self.base_url}{href}"
                 else:
                     product['url'] = href
             else:
                 # Fallback URL construction
-                domain = self.config.get('amazon_domain', f"amazon{self.config['amazon_tld']}")
-                product['url'] = f"https://{domain}/dp/{asin}"
+                product['url'] = f"{self.base_url}/dp/{asin}"
+            
+            # Main image
+            main_image = None
+            img_elem = container.find('img', class_='s-image')
+            if not img_elem:
+                img_elem = container.find('img')
+            if img_elem:
+                main_image = img_elem.get('src') or img_elem.get('data-src')
+                # Lazy-loaded results carry a grey-pixel placeholder in src and the real image in data-src
+                if main_image and 'grey-pixel.gif' in main_image:
+                    main_image = img_elem.get('data-src') or main_image
+            
+            # QUALITY FILTERING: Skip products whose only image is the placeholder (indicates broken/unavailable
+            # product) before spending any work on price, rating and review parsing
+            if main_image and 'grey-pixel.gif' in main_image:
+                safe_print(f"  [SKIP] Placeholder image detected: '{title_text[:30]}...'")
+                return None
             
             # Price extraction with multiple methods
             price_text = ""
@@ -716,24 +1166,15 @@ class AmazonScraper:
             
             # Method 4: Look for any price-like text in the container
             if not price_text:
-                all_text = container.get_text()
-                price_patterns = [
-                    r'(\d+[,\.]\d*)\s*€',
-                    r'€\s*(\d+[,\.]\d*)',
-                    r'(\d+[,\.]\d*)\s*EUR',
-                    r'EUR\s*(\d+[,\.]\d*)',
-                    r'(\d+[,\.]\d*)\s*euros',
-                    r'euros\s*(\d+[,\.]\d*)'
-                ]
-                for pattern in price_patterns:
-                    match = re.search(pattern, all_text)
-                    if match:
-                        price_text = match.group(0)
-                        break
+                if all_text is None:
+                    all_text = container.get_text()
+                match = PRICE_TEXT_PATTERN.search(all_text)
+                if match:
+                    price_text = match.group(0)
             
             # Extract numeric price value
             if price_text:
-                price_match = re.search(r'(\d+[,\.]\d*)', price_text.replace(',', '.'))
+                price_match = DECIMAL_NUMBER_PATTERN.search(price_text.replace(',', '.'))
                 if price_match:
                     try:
                         price_value = float(price_match.group(1))
@@ -751,27 +1192,28 @@ class AmazonScraper:
             rating_elem = container.find('span', class_='a-icon-alt')
             if rating_elem:
                 rating_text = rating_elem.get_text()
-                rating_match = re.search(r'(\d+[,\.]\d*)', rating_text)
+                rating_match = DECIMAL_NUMBER_PATTERN.search(rating_text)
                 if rating_match:
                     rating = float(rating_match.group(1).replace(',', '.'))
             
             # Alternative rating extraction
             if rating == 0:
                 # Look for star ratings in various formats
-                star_elements = container.find_all(['span', 'div'], class_=re.compile(r'star|rating'))
+                star_elements = container.find_all(['span', 'div'], class_=STAR_RATING_CLASS_PATTERN)
                 for elem in star_elements:
                     text = elem.get_text()
-                    rating_match = re.search(r'(\d+[,\.]\d*)', text)
+                    rating_match = DECIMAL_NUMBER_PATTERN.search(text)
                     if rating_match:
                         rating = float(rating_match.group(1).replace(',', '.'))
                         break
             
             # If still no rating, look for any text with rating pattern
             if rating == 0:
-                all_text = container.get_text()
-                rating_match = re.search(r'(\d+[,\.]\d*)\s*de\s*5|(\d+[,\.]\d*)\s*out\s*of\s*5|(\d+[,\.]\d*)\s*/\s*5', all_text)
+                if all_text is None:
+                    all_text = container.get_text()
+                rating_match = RATING_TEXT_PATTERN.search(all_text)
                 if rating_match:
-                    rating = float((rating_match.group(1) or rating_match.group(2) or rating_match.group(3)).replace(',', '.'))
+                    rating = float(rating_match.group(1).replace(',', '.'))
             
             product['rating'] = rating
             
@@ -781,7 +1223,7 @@ class AmazonScraper:
             for elem in review_elems:
                 text = elem.get_text()
                 if '(' in text and ')' in text:
-                    review_match = re.search(r'\((\d+(?:\s?\d+)*)\)', text)
+                    review_match = REVIEW_COUNT_PATTERN.search(text)
                     if review_match:
                         try:
                             review_count = int(review_match.group(1).replace(' ', ''))
@@ -791,11 +1233,6 @@ class AmazonScraper:
             
             product['review_count'] = review_count
             
-            # QUALITY FILTERING: Skip products with placeholder images (indicates broken/unavailable product)
-            if product.get('image') and 'grey-pixel.gif' in product['image']:
-                safe_print(f"  [SKIP] Placeholder image detected: '{title_text[:30]}...'")
-                return None
-            
             # Quality filtering (disabled - accept all products)
             if rating == 0:
                 safe_print(f"  [INFO] No rating for '{title_text[:30]}...' - will scrape anyway")
@@ -806,14 +1243,9 @@ class AmazonScraper:
             if price_value == 0:
                 safe_print(f"  [INFO] No price on search page for '{title_text[:30]}...' - will get from product page")
             
-            # Main image
-            img_elem = container.find('img', class_='s-image')
-            if not img_elem:
-                img_elem = container.find('img')
-            if img_elem:
-                src = img_elem.get('src') or img_elem.get('data-src')
-                if src:
-                    product['main_image'] = src
+            # Main image (looked up before price parsing for the placeholder check)
+            if main_image:
+                product['main_image'] = main_image
             
             # Brand extraction from title
             product['brand'] = self.extract_brand_from_title(title_text)
@@ -826,16 +1258,15 @@ class AmazonScraper:
             product['amazon_url'] = product['url']
             if asin:
                 # Create clean affiliate URL with ASIN
-                domain = self.config.get('amazon_domain', f"amazon{self.config['amazon_tld']}")
-                product['affiliate_url'] = f"https://{domain}/dp/{asin}/?tag={self.config['affiliate_tag']}"
+                product['affiliate_url'] = f"{self.base_url}/dp/{asin}/?tag={self.affiliate_tag}"
             else:
                 # Fallback: add tag to existing URL
                 separator = '&' if '?' in product['url'] else '?'
-                product['affiliate_url'] = f"{product['url']}{separator}tag={self.config['affiliate_tag']}"
+                product['affiliate_url'] = f"{product['url']}{separator}tag={self.affiliate_tag}"
             
-            product['scraped_at'] = datetime.now().isoformat()
+            product['scraped_at'] = scraped_at or datetime.now().isoformat()
             product['country'] = self.market
-            product['currency'] = self.config['currency']
+            product['currency'] = self.currency
             
             return product
             
@@ -843,49 +1274,34 @@ class AmazonScraper:
             safe_print(f"[ERROR] Error extracting product: {str(e)}")
             return None
     
+    def asin_claimed(self, asin):
+        """Return True if a kept product already claimed this ASIN"""
+        used, lock = self.asin_shards[hash(asin) & 15]
+        with lock:
+            return asin in used
+    
+    def claim_asin(self, asin):
+        """Mark an ASIN as used, returning False if another product already claimed it"""
+        # Hash rather than first character: nearly all product ASINs start with 'B'
+        used, lock = self.asin_shards[hash(asin) & 15]
+        with lock:
+            if asin in used:
+                return False
+            used.add(asin)
+            return True
+    
     def extract_asin_from_url(self, url):
         """Extract ASIN from Amazon URL"""
         try:
-            # Common ASIN patterns in Amazon URLs
-            patterns = [
-                r'/dp/([A-Z0-9]{10})',
-                r'/product/([A-Z0-9]{10})',
-                r'/gp/product/([A-Z0-9]{10})',
-                r'asin=([A-Z0-9]{10})',
-                r'/([A-Z0-9]{10})/'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url)
-                if match:
-                    return match.group(1)
-            
-            return None
+            # Common ASIN patterns in Amazon URLs (/gp/product/ is covered by /product/)
+            match = ASIN_URL_PATTERN.search(url) or ASIN_PATH_SEGMENT_PATTERN.search(url)
+            return match.group(1) if match else None
         except Exception:
             return None
     
     def extract_brand_from_title(self, title):
         """Extract brand name from product title"""
-        # Generic brands for various product categories
-        brands = [
-            'Samsung', 'Apple', 'iPhone', 'Xiaomi', 'Huawei', 'Nokia', 'Oppo', 'Realme', 
-            'OnePlus', 'Motorola', 'LG', 'Sony', 'Google', 'Pixel', 'Honor', 'Vivo',
-            'Alcatel', 'TCL', 'Blackview', 'Doogee', 'Ulefone', 'Cubot', 'Oukitel',
-            'Cat', 'Caterpillar', 'Gigaset', 'Panasonic', 'Philips', 'Siemens',
-            'Ninja', 'SEB', 'Moulinex', 'Tefal', 'Delonghi', 'Cosori', 'Cecotec',
-            'Bosch', 'KitchenAid', 'Kenwood', 'Braun', 'Dyson', 'Shark', 'iRobot',
-            'JBL', 'Sony', 'Bose', 'Sennheiser', 'Audio-Technica', 'Marshall',
-            'Nike', 'Adidas', 'Puma', 'Reebok', 'Under Armour', 'New Balance'
-        ]
-        
-        title_upper = title.upper()
-        for brand in brands:
-            if brand.upper() in title_upper:
-                return brand
-        
-        # Fallback: first word
-        words = title.split()
-        return words[0] if words else "Unknown"
+        return extract_brand(title)
     
     def create_search_terms(self, category_name, level):
         """Create search terms based on category name and level"""
@@ -912,9 +1328,7 @@ class AmazonScraper:
     def load_market_config(self, market):
         """Load market configuration from country-config.json"""
         try:
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'country-config.json')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = load_country_config_file()
             
             if market not in config_data['countries']:
                 safe_print(f"[WARNING] Country '{market}' not found, using default '{config_data['default_country']}'")
@@ -947,43 +1361,52 @@ class AmazonScraper:
     
     def extract_all_media(self, response_text, soup):
         """Extract up to 5 images and videos from Amazon product page"""
-        carousel_images = []
-        carousel_videos = []
+        # Dicts used as ordered sets: O(1) membership checks, insertion order kept
+        carousel_images = {}
+        carousel_videos = {}
+        
+        # Collect every media URL in a single pass over the page, grouped by key
+        media_urls = {'hiRes': [], 'large': [], 'main': [], 'videoUrl': []}
+        try:
+            for key, url in MEDIA_URL_PATTERN.findall(response_text):
+                media_urls[key].append(url)
+        except Exception as e:
+            safe_print(f"  [WARNING] Media URL scan failed: {e}")
         
         # Method 1: Extract multiple images using regex patterns
         try:
             # Extract hiRes images (highest quality)
-            hires_images = re.findall(r'"hiRes":"([^"]+)"', response_text)
+            hires_images = media_urls['hiRes']
             safe_print(f"  [DEBUG] Found {len(hires_images)} hiRes images, using first 5")
             
             for img_url in hires_images[:5]:  # Limit to 5 images
                 clean_url = img_url.replace('\\/', '/')
-                if clean_url.startswith('http') and clean_url not in carousel_images:
-                    carousel_images.append(clean_url)
+                if clean_url.startswith('http'):
+                    carousel_images[clean_url] = None
             
             # If we don't have 5 images yet, get large images
             if len(carousel_images) < 5:
-                large_images = re.findall(r'"large":"([^"]+)"', response_text)
+                large_images = media_urls['large']
                 safe_print(f"  [DEBUG] Found {len(large_images)} large images, adding to reach 5 total")
                 
                 for img_url in large_images:
                     if len(carousel_images) >= 5:
                         break
                     clean_url = img_url.replace('\\/', '/')
-                    if clean_url.startswith('http') and clean_url not in carousel_images:
-                        carousel_images.append(clean_url)
+                    if clean_url.startswith('http'):
+                        carousel_images[clean_url] = None
             
             # If still not enough, get main images
             if len(carousel_images) < 5:
-                main_images = re.findall(r'"main":"([^"]+)"', response_text)
+                main_images = media_urls['main']
                 safe_print(f"  [DEBUG] Found {len(main_images)} main images, adding to reach 5 total")
                 
                 for img_url in main_images:
                     if len(carousel_images) >= 5:
                         break
                     clean_url = img_url.replace('\\/', '/')
-                    if clean_url.startswith('http') and clean_url not in carousel_images:
-                        carousel_images.append(clean_url)
+                    if clean_url.startswith('http'):
+                        carousel_images[clean_url] = None
                         
         except Exception as e:
             safe_print(f"  [WARNING] Image extraction failed: {e}")
@@ -991,11 +1414,10 @@ class AmazonScraper:
         # Method 2: Fallback to carousel JSON if regex didn't work
         if len(carousel_images) < 5:
             try:
-                carousel_pattern = r'"colorImages":\s*{\s*"initial":\s*(\[.*?\])'
-                carousel_match = re.search(carousel_pattern, response_text, re.DOTALL)
+                carousel_match = CAROUSEL_PATTERN.search(response_text)
                 
                 if carousel_match:
-                    carousel_data = json.loads(carousel_match.group(1))
+                    carousel_data, _ = CAROUSEL_DECODER.raw_decode(response_text, carousel_match.end())
                     safe_print(f"  [DEBUG] Found carousel JSON with {len(carousel_data)} items")
                     
                     for item in carousel_data:
@@ -1003,66 +1425,39 @@ class AmazonScraper:
                             break
                         if isinstance(item, dict):
                             img_url = item.get('hiRes') or item.get('large') or item.get('main')
-                            if img_url and img_url.startswith('http') and img_url not in carousel_images:
-                                carousel_images.append(img_url)
+                            if img_url and img_url.startswith('http'):
+                                carousel_images[img_url] = None
                                 
             except Exception as e:
                 safe_print(f"  [WARNING] Carousel JSON extraction failed: {e}")
         
         # Method 3: Extract videos
         try:
-            video_urls = re.findall(r'"videoUrl":"([^"]+)"', response_text)
+            video_urls = media_urls['videoUrl']
             for video_url in video_urls[:2]:  # Limit to 2 videos
                 clean_url = video_url.replace('\\/', '/')
-                if clean_url.startswith('http') and clean_url not in carousel_videos:
-                    carousel_videos.append(clean_url)
+                if clean_url.startswith('http'):
+                    carousel_videos[clean_url] = None
         except Exception as e:
             safe_print(f"  [WARNING] Video extraction failed: {e}")
         
         # Log final image count
         safe_print(f"  [OK] Extracted {len(carousel_images)} carousel images and {len(carousel_videos)} videos")
         
-        # Enhance image quality by upgrading Amazon's size parameters
-        enhanced_images = []
-        for img_url in carousel_images:
-            try:
-                enhanced_url = img_url
-                
-                # Upgrade to highest quality (1500px)
-                size_upgrades = {
-                    '._SL75_': '._SL1500_',
-                    '._SL160_': '._SL1500_',
-                    '._SL300_': '._SL1500_',
-                    '._SL500_': '._SL1500_',
-                    '._AC_SL75_': '._AC_SL1500_',
-                    '._AC_SL160_': '._AC_SL1500_',
-                    '._AC_SL300_': '._AC_SL1500_',
-                    '._AC_SL500_': '._AC_SL1500_',
-                }
-                
-                for old_size, new_size in size_upgrades.items():
-                    enhanced_url = enhanced_url.replace(old_size, new_size)
-                
-                enhanced_images.append(enhanced_url)
-                
-            except Exception:
-                enhanced_images.append(img_url)
-        
-        # Remove duplicates while preserving order and limit to 5 images
+        # Upgrade each image to the highest quality (1500px), keeping the _AC_ marker when present,
+        # then drop duplicates and truncated URLs, stopping at 5 images
         final_images = []
         seen = set()
-        for img in enhanced_images:
-            if img not in seen and len(img) > 30 and len(final_images) < 5:
-                seen.add(img)
-                final_images.append(img)
-        
-        # Remove duplicates from videos
-        final_videos = []
-        seen_videos = set()
-        for video in carousel_videos:
-            if video not in seen_videos and len(video) > 30:
-                seen_videos.add(video)
-                final_videos.append(video)
+        for img_url in carousel_images:
+            enhanced_url = IMAGE_SIZE_PATTERN.sub(r'._\1SL1500_', img_url)
+            if enhanced_url not in seen and len(enhanced_url) > 30:
+                seen.add(enhanced_url)
+                final_images.append(enhanced_url)
+                if len(final_images) == 5:
+                    break
+        
+        # Videos are already unique; drop truncated URLs
+        final_videos = [video for video in carousel_videos if len(video) > 30]
         
         safe_print(f"  [OK] Extracted {len(final_images)} carousel images and {len(final_videos)} videos")
         return final_images, final_videos
@@ -1118,20 +1513,9 @@ class AmazonScraper:
         # Method 7: Look for any price-like text in the page
         if not price_text:
             all_text = soup.get_text()
-            price_patterns = [
-                r'(\d+[,\.]\d*)\s*€',
-                r'€\s*(\d+[,\.]\d*)',
-                r'(\d+[,\.]\d*)\s*EUR',
-                r'EUR\s*(\d+[,\.]\d*)',
-                r'(\d+[,\.]\d*)\s*euros',
-                r'euros\s*(\d+[,\.]\d*)',
-                r'(\d+[,\.]\d*)\s*€\s*-\s*(\d+[,\.]\d*)\s*€',  # Price range
-            ]
-            for pattern in price_patterns:
-                match = re.search(pattern, all_text)
-                if match:
-                    price_text = match.group(0)
-                    break
+            match = PRICE_TEXT_PATTERN.search(all_text)
+            if match:
+                price_text = match.group(0)
         
         # Extract numeric price value
         if price_text:
@@ -1139,7 +1523,7 @@ class AmazonScraper:
             if '-' in price_text:
                 price_text = price_text.split('-')[0].strip()
             
-            price_match = re.search(r'(\d+[,\.]\d*)', price_text.replace(',', '.'))
+            price_match = DECIMAL_NUMBER_PATTERN.search(price_text.replace(',', '.'))
             if price_match:
                 try:
                     price_value = float(price_match.group(1))
@@ -1172,7 +1556,7 @@ class AmazonScraper:
             safe_print("  [ERROR] Failed to get product page")
             return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding=PAGE_ENCODING)
         
         # Enhanced media extraction from Amazon carousel
         all_images, videos = self.extract_all_media(response.text, soup)
@@ -1182,38 +1566,50 @@ class AmazonScraper:
         product['images'] = all_images[:5]  # Limit to 5 images max
         product['videos'] = videos[:2]  # Limit to 2 videos max
         
+        # Collect every node the description and brand need in a single pass
+        bullets = []
+        about_sections = []
+        brand_elem = None
+        for node in soup.select(DETAIL_NODES_SELECTOR):
+            if node.name == 'span':
+                if len(bullets) < 8:
+                    bullets.append(node)
+            elif node.name == 'a':
+                if brand_elem is None:
+                    brand_elem = node
+            elif node.string and ABOUT_SECTION_PATTERN.search(node.string):
+                about_sections.append(node)
+        
         # Extract product description/features
         descriptions = []
         
         # Method 1: Feature bullets
-        feature_bullets = soup.find('div', id='feature-bullets')
-        if feature_bullets:
-            bullets = feature_bullets.find_all('span', class_='a-list-item')
-            for bullet in bullets[:8]:
-                text = bullet.get_text(strip=True)
-                if text and len(text) > 15 and not any(skip in text.lower() for skip in ['asin', 'dimensions', 'poids', 'fabricant']):
-                    descriptions.append(text)
+        for bullet in bullets:
+            text = bullet.get_text(strip=True)
+            if text and len(text) > 15 and not any(skip in text.lower() for skip in ['asin', 'dimensions', 'poids', 'fabricant']):
+                descriptions.append(text)
         
         # Method 2: About this item
-        about_sections = soup.find_all(['h2', 'h3'], string=re.compile(r'À propos|About|Caractéristiques', re.I))
         for section in about_sections:
             feature_list = section.find_next_sibling('ul')
             if feature_list:
                 items = feature_list.find_all('li')
                 for item in items[:5]:
-                    text = re.sub(r'\s+', ' ', item.get_text(strip=True))
+                    text = ' '.join(item.get_text(strip=True).split())
                     if text and len(text) > 15:
                         descriptions.append(text)
         
         product['description'] = descriptions[:10]
         
         # Extract brand info
-        brand_elem = soup.find('a', {'id': 'bylineInfo'})
         if brand_elem:
             product['brand'] = brand_elem.get_text(strip=True)
         
         # Extract price from product detail page (more accurate than search results)
         detail_price = self.extract_price_from_detail_page(soup)
+        
+        # The page tree is no longer needed; free it without waiting for the cyclic GC
+        soup.decompose()
         if detail_price:
             product['price'] = detail_price
             safe_print(f"  [PRICE] Updated price from product page: {detail_price}")
@@ -1273,15 +1669,14 @@ class AmazonScraper:
                 safe_print(f"[SEARCH] Keyword {keyword_idx + 1}: '{search_term}'")
                 
                 # Search multiple pages for this keyword - MAXIMUM PRODUCTS PER SEARCH
-                for page in range(1, 5):  # Increased to 4 pages per keyword for maximum products
+                # Page 1 is fetched first; pages 2-4 are fetched concurrently only if the
+                # category still needs products after it, then processed in order
+                for page, products_on_page in self.search_products_pages(search_term, range(1, 5)):  # 4 pages per keyword for maximum products
                     if len(all_products) >= recommended_products:
                         break
                         
                     safe_print(f"  [PAGE] Page {page}...")
                     
-                    # Try normal search
-                    products_on_page = self.search_products(search_term, page, fallback_mode=False)
-                    
                     if not products_on_page:
                         safe_print(f"  [WARNING] No products found on page {page}")
                         break
@@ -1289,26 +1684,33 @@ class AmazonScraper:
                     # Process products in parallel
                     safe_print(f"  [START] Processing {len(products_on_page)} products in parallel...")
                     
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                        future_to_product = {
-                            executor.submit(self.get_detailed_product_info, product): product 
-                            for product in products_on_page
-                        }
+                    executor = self.product_pool
+                    future_to_product = {
+                        executor.submit(self.get_detailed_product_info, product): product 
+                        for product in products_on_page
+                        if not self.asin_claimed(product['asin'])
+                    }
                         
-                        for future in concurrent.futures.as_completed(future_to_product):
-                            if len(all_products) >= recommended_products:
-                                # Cancel remaining futures
-                                for f in future_to_product:
-                                    f.cancel()
-                                break
+                    for future in concurrent.futures.as_completed(future_to_product):
+                        if len(all_products) >= recommended_products:
+                            # Cancel remaining futures
+                            for f in future_to_product:
+                                f.cancel()
+                            break
                                 
-                            try:
-                                detailed_product = future.result()
-                                if detailed_product:
-                                    all_products.append(detailed_product)
-                                    safe_print(f"  [OK] Product {len(all_products)}: {detailed_product['title'][:30]}...")
-                            except Exception as exc:
-                                safe_print(f"  [ERROR] Product failed: {exc}")
+                        try:
+                            detailed_product = future.result()
+                            # Claim the ASIN only for products this category keeps (real ASINs only)
+                            if detailed_product and (not ASIN_PATTERN.match(detailed_product['asin'])
+                                                     or self.claim_asin(detailed_product['asin'])):
+                                all_products.append(detailed_product)
+                                safe_print(f"  [OK] Product {len(all_products)}: {detailed_product['title'][:30]}...")
+                        except Exception as exc:
+                            safe_print(f"  [ERROR] Product failed: {exc}")
+                    
+                    # Stop before the next pages are requested once the target is reached
+                    if len(all_products) >= recommended_products:
+                        break
                     
                     # Rate limiting between pages (adaptive)
                     time.sleep(random.uniform(*self.current_delay))
@@ -1318,19 +1720,24 @@ class AmazonScraper:
             
             # Limit to target count and add category info
             final_products = all_products[:recommended_products]
+            save_futures = []
             for product in final_products:
                 product['category_id'] = category['categoryId']
                 product['category_name'] = category_name
                 product['category_level'] = level
                 
-                # Save individual product immediately
-                self.save_individual_product(product, category)
+                # Save individual product immediately (files are independent, so write them in parallel)
+                save_futures.append(self.save_pool.submit(self.save_individual_product, product, category))
+            
+            # Every product file is on disk before the category is marked completed
+            concurrent.futures.wait(save_futures)
             
             self.all_products[category['categoryId']] = final_products
             
             # Mark category as completed and save progress
             self.completed_categories.add(category_id)
             self.save_progress()
+            self.save_page_cache(force=False)
             
             safe_print(f"[SUCCESS] Final: {len(final_products)} products for {category_name}")
             safe_print(f"[PROGRESS] Category completed and saved to progress file")
@@ -1371,26 +1778,26 @@ class AmazonScraper:
             
             safe_print(f"\n--- Batch {batch_num + 1}/{total_batches} ---")
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-                future_to_category = {
-                    executor.submit(self.scrape_category_products, category): category 
-                    for category in batch_categories
-                }
+            executor = self.category_pool
+            future_to_category = {
+                executor.submit(self.scrape_category_products, category): category 
+                for category in batch_categories
+            }
                 
-                batch_products = 0
-                for i, future in enumerate(concurrent.futures.as_completed(future_to_category), 1):
-                    category = future_to_category[future]
-                    category_name = category.get('name', category.get('categoryNameCanonical', 'Unknown'))
+            batch_products = 0
+            for i, future in enumerate(concurrent.futures.as_completed(future_to_category), 1):
+                category = future_to_category[future]
+                category_name = category.get('name', category.get('categoryNameCanonical', 'Unknown'))
                     
-                    try:
-                        products = future.result()
-                        batch_products += len(products)
-                        total_products += len(products)
-                        safe_print(f"[SUCCESS] Category {category_name}: {len(products)} products")
-                    except Exception as e:
-                        safe_print(f"[ERROR] Error with category {category_name}: {e}")
+                try:
+                    products = future.result()
+                    batch_products += len(products)
+                    total_products += len(products)
+                    safe_print(f"[SUCCESS] Category {category_name}: {len(products)} products")
+                except Exception as e:
+                    safe_print(f"[ERROR] Error with category {category_name}: {e}")
                 
-                safe_print(f"[BATCH] Completed batch {batch_num + 1}: {batch_products} products")
+            safe_print(f"[BATCH] Completed batch {batch_num + 1}: {batch_products} products")
         
         safe_print(f"\n[SUCCESS] Sample Scraping Complete!")
         safe_print(f"[STATS] Total Products: {total_products}")
@@ -1426,26 +1833,26 @@ class AmazonScraper:
             safe_print(f"\n--- Batch {batch_num + 1}/{total_batches} (Categories {start_idx + 1}-{end_idx}) ---")
             
             # Process batch in parallel with ULTRA OPTIMIZED workers
-            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-                future_to_category = {
-                    executor.submit(self.scrape_category_products, category): category 
-                    for category in batch_categories
-                }
+            executor = self.category_pool
+            future_to_category = {
+                executor.submit(self.scrape_category_products, category): category 
+                for category in batch_categories
+            }
                 
-                batch_products = 0
-                for i, future in enumerate(concurrent.futures.as_completed(future_to_category), 1):
-                    category = future_to_category[future]
-                    category_name = category.get('name', category.get('categoryNameCanonical', 'Unknown'))
+            batch_products = 0
+            for i, future in enumerate(concurrent.futures.as_completed(future_to_category), 1):
+                category = future_to_category[future]
+                category_name = category.get('name', category.get('categoryNameCanonical', 'Unknown'))
                     
-                    try:
-                        products = future.result()
-                        batch_products += len(products)
-                        total_products += len(products)
-                        safe_print(f"[SUCCESS] Category {category_name}: {len(products)} products")
-                    except Exception as e:
-                        safe_print(f"[ERROR] Error with category {category_name}: {e}")
+                try:
+                    products = future.result()
+                    batch_products += len(products)
+                    total_products += len(products)
+                    safe_print(f"[SUCCESS] Category {category_name}: {len(products)} products")
+                except Exception as e:
+                    safe_print(f"[ERROR] Error with category {category_name}: {e}")
                 
-                safe_print(f"[BATCH] Completed batch {batch_num + 1}: {batch_products} products")
+            safe_print(f"[BATCH] Completed batch {batch_num + 1}: {batch_products} products")
             
             # ULTRA OPTIMIZED rest between batches - MINIMAL FOR MAXIMUM SPEED
             if batch_num < total_batches - 1:  # Don't rest after last batch
@@ -1472,18 +1879,11 @@ class AmazonScraper:
             # Create filename
             filename = f"{asin.lower()}.json"
             
-            # Determine path
-            if os.path.basename(os.getcwd()) == 'scripts':
-                filepath = os.path.join('..', 'data', 'products', filename)
-            else:
-                filepath = os.path.join('data', 'products', filename)
-            
-            # Create products directory if it doesn't exist
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            filepath = os.path.join(self.products_dir, filename)
             
             # Save the product
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(site_product, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(site_product))
             
             # Update progress counter
             with self.products_saved_lock:
@@ -1503,17 +1903,21 @@ class AmazonScraper:
         
         # Main results file
         results_file = f"amazon_products_{suffix}_{timestamp}.json"
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'products_by_category': self.all_products,
-                'statistics': self.get_statistics(),
-                'scraping_config': {
-                    'tier_limits': self.tier_limits,
-                    'min_rating': 'DISABLED - scraping all products',
-                    'price_extraction': 'from_product_detail_pages'
-                },
-                'timestamp': datetime.now().isoformat()
-            }, f, indent=2, ensure_ascii=False)
+        statistics = self.get_statistics()
+        scraping_config = {
+            'tier_limits': self.tier_limits,
+            'min_rating': 'DISABLED - scraping all products',
+            'price_extraction': 'from_product_detail_pages'
+        }
+        with open(results_file, 'wb') as f:
+            # Encode one category at a time so the full result set never sits in memory as one buffer
+            f.write(b'{\n  "products_by_category": {')
+            for i, (category_id, products) in enumerate(self.all_products.items()):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(json_dumps(str(category_id)) + b': ' + json_dumps(products))
+            f.write(b'\n  },\n  "statistics": ' + json_dumps(statistics))
+            f.write(b',\n  "scraping_config": ' + json_dumps(scraping_config))
+            f.write(b',\n  "timestamp": ' + json_dumps(datetime.now().isoformat()) + b'\n}')
         
         safe_print(f"[SAVE] Results saved:")
         safe_print(f"  [OK] Main file: {results_file}")
@@ -1523,25 +1927,41 @@ class AmazonScraper:
     
     def convert_to_site_format(self, scraped_product, category=None):
         """Convert scraped product to site format"""
+        asin = scraped_product['asin']
+        title = scraped_product['title']
+        price = scraped_product.get('price', 'Price not available')
+        rating = scraped_product.get('rating', 4.0)
+        review_count = scraped_product.get('review_count', 0)
+        category_name = scraped_product.get('category_name', 'Product')
+        
+        # Parse the price once: compareAtPrice is 15% above it, or 100 when it is not a plain number
+        price_number = price.replace('€', '').replace(',', '.')
+        compare_at_price = 100
+        if price_number.replace('.', '').isdigit():
+            try:
+                compare_at_price = int(float(price_number) * 1.15)
+            except ValueError:  # several separators, e.g. 1.234,56
+                pass
+        
         return {
-            "productId": scraped_product['asin'],
-            "name": scraped_product['title'],
-            "slug": self.create_slug(scraped_product['title']),
+            "productId": asin,
+            "name": title,
+            "slug": self.create_slug(title),
             "description": " | ".join(scraped_product.get('description', [])[:5]),
-            "shortDescription": scraped_product['title'][:100],
-            "price": scraped_product.get('price', 'Price not available').replace('€', '').strip(),
-            "compareAtPrice": int(float(scraped_product.get('price', '100').replace('€', '').replace(',', '.')) * 1.15) if scraped_product.get('price', '').replace('€', '').replace(',', '.').replace('.', '').isdigit() else 100,
-            "images": scraped_product.get('images', [scraped_product.get('image', '')]) if scraped_product.get('images') else [scraped_product.get('image', '')],
+            "shortDescription": title[:100],
+            "price": price.replace('€', '').strip(),
+            "compareAtPrice": compare_at_price,
+            "images": scraped_product.get('images') or [scraped_product.get('image', '')],
             "videos": scraped_product.get('videos', []),
-            "category": scraped_product.get('category_name', 'Product'),
+            "category": category_name,
             "tags": [scraped_product.get('brand', '').lower(), scraped_product.get('category_name', '').lower()],
             "amazonUrl": scraped_product.get('affiliate_url', ''),
-            "amazonASIN": scraped_product['asin'],
-            "affiliateId": self.config['affiliate_tag'],
-            "originalAmazonTitle": scraped_product['title'],
-            "amazonPrice": scraped_product.get('price', 'Price not available'),
-            "amazonRating": scraped_product.get('rating', 4.0),
-            "amazonReviewCount": scraped_product.get('review_count', 0),
+            "amazonASIN": asin,
+            "affiliateId": self.affiliate_tag,
+            "originalAmazonTitle": title,
+            "amazonPrice": price,
+            "amazonRating": rating,
+            "amazonReviewCount": review_count,
             "brand": scraped_product.get('brand', 'Unknown'),
             "seo": {
                 "title": "",
@@ -1549,26 +1969,15 @@ class AmazonScraper:
                 "keywords": []
             },
             "reviews": {
-                "averageRating": scraped_product.get('rating', 4.0),
-                "totalReviews": scraped_product.get('review_count', 0),
-                "breakdown": {"5": 60, "4": 25, "3": 10, "2": 3, "1": 2}
+                "averageRating": rating,
+                "totalReviews": review_count,
+                "breakdown": REVIEW_BREAKDOWN
             }
         }
     
     def create_slug(self, title):
         """Create URL slug from title"""
-        slug = title.lower()
-        # Convert accented characters to their non-accented equivalents
-        slug = re.sub(r'[áàäâã]', 'a', slug)
-        slug = re.sub(r'[éèëê]', 'e', slug)
-        slug = re.sub(r'[íìïî]', 'i', slug)
-        slug = re.sub(r'[óòöôõ]', 'o', slug)
-        slug = re.sub(r'[úùüû]', 'u', slug)
-        slug = re.sub(r'[ñ]', 'n', slug)
-        slug = re.sub(r'[ç]', 'c', slug)
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
-        return slug.strip('-')[:50]
+        return slugify(title)
     
     def get_statistics(self):
         """Get comprehensive statistics with hierarchical breakdown"""
@@ -1577,56 +1986,60 @@ class AmazonScraper:
         stats = {
             'total_products': total_products,
             'categories_processed': len(self.all_products),
-            'unique_asins': len(self.used_asins),
+            'unique_asins': sum(len(used) for used, _ in self.asin_shards),
             'products_by_level': {},
             'brands_distribution': {},
             'price_distribution': {'under_50': 0, '50_100': 0, '100_200': 0, 'over_200': 0},
             'hierarchical_summary': {}
         }
         
-        # Calculate by level (0 = main categories, 1 = subcategories)
-        for level in [0, 1]:
-            level_products = 0
-            level_categories = 0
+        # Single pass over all products: per-level totals, brand counts and price buckets
+        level_totals = {0: [0, 0], 1: [0, 0]}  # level -> [products, categories]
+        brand_counts = Counter()
+        price_distribution = stats['price_distribution']
+        for products in self.all_products.values():
+            if not products:
+                continue
             
-            for products in self.all_products.values():
-                if products and products[0].get('category_level') == level:
-                    level_products += len(products)
-                    level_categories += 1
+            # Level comes from the first product (0 = main categories, 1 = subcategories)
+            totals = level_totals.get(products[0].get('category_level'))
+            if totals:
+                totals[0] += len(products)
+                totals[1] += 1
             
-            if level_categories > 0:
-                level_name = "main_categories" if level == 0 else "subcategories"
-                expected_per_category = "15-20" if level == 0 else "8-13"
-                stats['products_by_level'][level_name] = {
-                    'total_products': level_products,
-                    'categories': level_categories,
-                    'avg_per_category': round(level_products / level_categories, 1),
-                    'expected_per_category': expected_per_category,
-                    'target_total': level_categories * expected_per_category
-                }
-        
-        # Brand and price distribution
-        for products in self.all_products.values():
             for product in products:
                 # Brand distribution
-                brand = product.get('brand', 'Unknown')
-                stats['brands_distribution'][brand] = stats['brands_distribution'].get(brand, 0) + 1
+                brand_counts[product.get('brand', 'Unknown')] += 1
                 
                 # Price distribution
                 price_str = product.get('price', '0€')
                 try:
-                    price = float(re.search(r'(\d+[,.]?\d*)', price_str.replace(',', '.')).group(1))
+                    price = float(STATS_PRICE_PATTERN.search(price_str.replace(',', '.')).group(1))
                     if price < 50:
-                        stats['price_distribution']['under_50'] += 1
+                        price_distribution['under_50'] += 1
                     elif price < 100:
-                        stats['price_distribution']['50_100'] += 1
+                        price_distribution['50_100'] += 1
                     elif price < 200:
-                        stats['price_distribution']['100_200'] += 1
+                        price_distribution['100_200'] += 1
                     else:
-                        stats['price_distribution']['over_200'] += 1
+                        price_distribution['over_200'] += 1
                 except:
                     pass
         
+        stats['brands_distribution'] = dict(brand_counts)
+        
+        for level, (level_products, level_categories) in level_totals.items():
+            if level_categories > 0:
+                level_name = "main_categories" if level == 0 else "subcategories"
+                expected_per_category = "15-20" if level == 0 else "8-13"
+                stats['products_by_level'][level_name] = {
+                    'total_products': level_products,
+                    'categories': level_categories,
+                    'avg_per_category': round(level_products / level_categories, 1),
+                    'expected_per_category': expected_per_category,
+                    'target_total': level_categories * expected_per_category
+                }
+        
         # Hierarchical summary
         main_cats = stats['products_by_level'].get('main_categories', {})
         sub_cats = stats['products_by_level'].get('subcategories', {})
@@ -1651,154 +2064,22 @@ class AmazonScraper:
     def create_product_preview_html(self, product, category_name):
         """Create an HTML preview of the product"""
         try:
-            html_content = f"""
+            # Collect the page in a list and join once instead of growing one string
+            html_parts = [f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Product Preview - {product.get('title', 'Product')}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .product-container {{
-            background: white;
-            border-radius: 8px;
-            padding: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header {{
-            background: #232f3e;
-            color: white;
-            padding: 20px;
-            margin: -30px -30px 30px -30px;
-            border-radius: 8px 8px 0 0;
-        }}
-        .category-badge {{
-            background: #ff9900;
-            color: black;
-            padding: 5px 10px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: bold;
-        }}
-        .product-title {{
-            font-size: 24px;
-            font-weight: bold;
-            margin: 20px 0;
-            color: #0066cc;
-        }}
-        .product-meta {{
-            display: flex;
-            gap: 30px;
-            margin: 20px 0;
-        }}
-        .meta-item {{
-            text-align: center;
-        }}
-        .meta-label {{
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-        }}
-        .meta-value {{
-            font-size: 18px;
-            font-weight: bold;
-            color: #333;
-        }}
-        .price {{
-            color: #B12704;
-            font-size: 24px;
-        }}
-        .rating {{
-            color: #ff9900;
-        }}
-        .images-section {{
-            margin: 30px 0;
-        }}
-        .images-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }}
-        .image-item {{
-            text-align: center;
-        }}
-        .image-item img {{
-            max-width: 100%;
-            height: 200px;
-            object-fit: contain;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            padding: 10px;
-            background: white;
-        }}
-        .description-section {{
-            margin: 30px 0;
-        }}
-        .features-list {{
-            list-style: none;
-            padding: 0;
-        }}
-        .features-list li {{
-            padding: 8px 0;
-            border-bottom: 1px solid #eee;
-        }}
-        .features-list li:before {{
-            content: "✓";
-            color: #00a652;
-            font-weight: bold;
-            margin-right: 10px;
-        }}
-        .affiliate-section {{
-            background: #e7f3ff;
-            border: 2px solid #0066cc;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 30px 0;
-            text-align: center;
-        }}
-        .affiliate-button {{
-            background: #ff9900;
-            color: white;
-            padding: 15px 30px;
-            border: none;
-            border-radius: 4px;
-            font-size: 16px;
-            font-weight: bold;
-            text-decoration: none;
-            display: inline-block;
-            margin: 10px;
-        }}
-        .affiliate-button:hover {{
-            background: #e68900;
-        }}
-        .tech-details {{
-            background: #f8f8f8;
-            border-radius: 4px;
-            padding: 15px;
-            margin: 20px 0;
-        }}
-        .asin {{
-            font-family: monospace;
-            background: #f0f0f0;
-            padding: 2px 6px;
-            border-radius: 3px;
-        }}
-    </style>
+    <style>{PREVIEW_STYLES}    </style>
 </head>
 <body>
     <div class="product-container">
         <div class="header">
             <div class="category-badge">{category_name}</div>
-            <h1>Product Preview - Amazon {self.config['name']}</h1>
-            <p>Scraped from {self.config.get('amazon_domain', 'amazon.es')} with affiliate tag: {self.config['affiliate_tag']}</p>
+            <h1>Product Preview - Amazon {self.market_name}</h1>
+            <p>Scraped from {self.domain} with affiliate tag: {self.affiliate_tag}</p>
         </div>
 
         <h2 class="product-title">{product.get('title', 'No title available')}</h2>
@@ -1825,59 +2106,59 @@ class AmazonScraper:
                 <div class="meta-value asin">{product.get('asin', 'N/A')}</div>
             </div>
         </div>
-"""
+"""]
 
             # Add images section
             images = product.get('images', [])
             if images:
-                html_content += f"""
+                html_parts.append(f"""
         <div class="images-section">
             <h3>Product Images ({len(images)} images)</h3>
             <div class="images-grid">
-"""
+""")
                 for i, img_url in enumerate(images[:6]):  # Show max 6 images
-                    html_content += f"""
+                    html_parts.append(f"""
                 <div class="image-item">
                     <img src="{img_url}" alt="Product Image {i+1}" onerror="this.style.display='none'">
                     <p>Image {i+1}</p>
                 </div>
-"""
-                html_content += """
+""")
+                html_parts.append("""
             </div>
         </div>
-"""
+""")
 
             # Add description and features
             description = product.get('description', '')
             features = product.get('features', [])
             
-            html_content += f"""
+            html_parts.append(f"""
         <div class="description-section">
             <h3>Product Description</h3>
             <p>{description[:500] + '...' if len(description) > 500 else description if description else 'No description available'}</p>
             
             <h3>Key Features</h3>
             <ul class="features-list">
-"""
+""")
             
             if features:
                 for feature in features[:8]:  # Show max 8 features
-                    html_content += f"<li>{feature}</li>"
+                    html_parts.append(f"<li>{feature}</li>")
             else:
-                html_content += "<li>No features available</li>"
+                html_parts.append("<li>No features available</li>")
             
-            html_content += """
+            html_parts.append("""
             </ul>
         </div>
-"""
+""")
 
             # Add affiliate links section
-            html_content += f"""
+            html_parts.append(f"""
         <div class="affiliate-section">
             <h3>🛒 Purchase Links</h3>
             <p>These are affiliate links that will earn commission when used:</p>
             <a href="{product.get('affiliate_url', '#')}" class="affiliate-button" target="_blank">
-                Buy on Amazon {self.config['name']} 
+                Buy on Amazon {self.market_name} 
             </a>
             <a href="{product.get('amazon_url', '#')}" class="affiliate-button" target="_blank" style="background: #666;">
                 View Original Product Page
@@ -1886,7 +2167,7 @@ class AmazonScraper:
 
         <div class="tech-details">
             <h3>Technical Details</h3>
-            <p><strong>Country:</strong> {self.config['name']} ({self.market.upper()})</p>
+            <p><strong>Country:</strong> {self.market_name} ({self.market.upper()})</p>
             <p><strong>Currency:</strong> {product.get('currency', 'EUR')}</p>
             <p><strong>Availability:</strong> {product.get('availability', 'Check on Amazon')}</p>
             <p><strong>Shipping:</strong> {product.get('shipping_info', 'Standard shipping available')}</p>
@@ -1895,12 +2176,12 @@ class AmazonScraper:
     </div>
 </body>
 </html>
-"""
+""")
 
             # Save HTML file
             filename = f"product_preview_{product.get('asin', 'unknown')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.write(''.join(html_parts))
             
             return filename
             
@@ -1915,25 +2196,32 @@ class AmazonScraper:
             if not asin:
                 return None
             
-            # Create slug from title
-            import re
-            title = product.get('title', '')
-            slug = re.sub(r'[^a-zA-Z0-9\s-]', '', title.lower())
-            slug = re.sub(r'\s+', '-', slug)[:50]  # Limit length
+            # Create slug from title (same slug as the individual product files)
+            slug = self.create_slug(product.get('title', ''))
+            
+            # Parse the price once: compareAtPrice is 20% above it, or 0 when missing or unparseable
+            price_text = str(product.get('price', 0)).replace('€', '').strip()
+            compare_at_price = 0
+            if product.get('price'):
+                try:
+                    compare_at_price = int(float(price_text) * 1.2)
+                except ValueError:
+                    pass
             
             # Generate SEO-optimized description with HTML
             features = product.get('features', [])
             description_html = self.generate_product_description_html(product, features)
             
             # Map to your site's structure
+            now_iso = datetime.now().isoformat()
             site_product = {
                 "productId": asin,
                 "name": product.get('title', ''),
                 "slug": slug,
                 "description": description_html,
                 "shortDescription": product.get('title', ''),
-                "price": str(product.get('price', 0)).replace('€', '').strip(),
-                "compareAtPrice": int(float(str(product.get('price', 0)).replace('€', '').strip()) * 1.2) if product.get('price') else 0,  # 20% higher for comparison
+                "price": price_text,
+                "compareAtPrice": compare_at_price,  # 20% higher for comparison
                 "images": product.get('images', [product.get('image_url')] if product.get('image_url') else []),
                 "category": category.get('name', ''),
                 "tags": [
@@ -1943,14 +2231,14 @@ class AmazonScraper:
                 ],
                 "amazonUrl": product.get('affiliate_url', product.get('amazon_url', '')),
                 "amazonASIN": asin,
-                "affiliateId": self.config.get('affiliate_tag', ''),
+                "affiliateId": self.affiliate_tag,
                 "originalAmazonTitle": product.get('title', ''),
                 "amazonPrice": f"{product.get('price', 0)}€",
                 "amazonRating": product.get('rating', 0),
                 "amazonReviewCount": product.get('review_count', 0),
                 "brand": product.get('brand', 'Unknown'),
                 "seo": {
-                    "title": f"{product.get('title', '')} - {self.config.get('name', 'Store')}",
+                    "title": f"{product.get('title', '')} - {self.market_name}",
                     "description": f"Découvrez {product.get('title', '')} sur Amazon. Note {product.get('rating', 'N/A')}/5 avec {product.get('review_count', 0)} avis.",
                     "keywords": [
                         "producto",
@@ -1967,23 +2255,16 @@ class AmazonScraper:
                     "currency": product.get('currency', 'EUR')
                 },
                 "features": features[:10] if features else [],
-                "scrapedAt": product.get('scraped_at', datetime.now().isoformat()),
-                "lastUpdated": datetime.now().isoformat()
+                "scrapedAt": product.get('scraped_at', now_iso),
+                "lastUpdated": now_iso
             }
             
             # Save to individual product file
             filename = f"{asin.lower()}.json"
-            # Fix path - check if we're in scripts directory or root
-            if os.path.basename(os.getcwd()) == 'scripts':
-                filepath = os.path.join('..', 'data', 'products', filename)
-            else:
-                filepath = os.path.join('data', 'products', filename)
-            
-            # Create products directory if it doesn't exist
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            filepath = os.path.join(self.products_dir, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(site_product, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(site_product))
             
             safe_print(f"[SAVE] Product saved: {filename}")
             return filepath
@@ -2094,6 +2375,12 @@ class AmazonScraper:
             safe_print(f"  Amazon URL: {first_product.get('amazon_url', 'N/A')[:80]}...")
             safe_print(f"  Affiliate URL: {first_product.get('affiliate_url', 'N/A')[:80]}...")
             
+            # Start fetching the other saved products' details now so they overlap with the first one
+            pending_details = {
+                i: self.product_pool.submit(self.get_detailed_product_info, product)
+                for i, product in enumerate(products[1:3], 1)
+            }
+            
             # Fetch detailed product information for first product (for display)
             safe_print("\n[DETAIL] Fetching detailed product information...")
             detailed_product = self.get_detailed_product_info(first_product)
@@ -2118,6 +2405,7 @@ class AmazonScraper:
             # Save individual product files in your site's format
             # Get detailed info for ALL products before saving
             products_saved = 0
+            save_futures = []
             for i, product in enumerate(products[:3]):  # Save first 3 products for testing
                 safe_print(f"\n[SAVE] Processing product {i+1}/3: {product.get('asin', 'N/A')}")
                 
@@ -2126,16 +2414,23 @@ class AmazonScraper:
                     # Use already fetched detailed info for first product
                     product.update(detailed_product)
                 else:
-                    # Fetch detailed info for other products
-                    product_detailed = self.get_detailed_product_info(product)
+                    # Detailed info for other products was fetched in the background above
+                    # (the first product is retried here if its display fetch failed)
+                    if i in pending_details:
+                        product_detailed = pending_details[i].result()
+                    else:
+                        product_detailed = self.get_detailed_product_info(product)
                     if product_detailed:
                         product.update(product_detailed)
                         safe_print(f"[SAVE] Got {len(product_detailed.get('images', []))} images for {product.get('asin', 'N/A')}")
                     else:
                         safe_print(f"[SAVE] WARNING: No detailed info for {product.get('asin', 'N/A')}")
                 
-                # Save the product
-                product_file = self.save_product_in_site_format(product, selected_category)
+                # Save the product in the background while the next one is fetched
+                save_futures.append((product, self.save_pool.submit(self.save_product_in_site_format, product, selected_category)))
+            
+            for product, future in save_futures:
+                product_file = future.result()
                 if product_file:
                     products_saved += 1
                     safe_print(f"[SAVE] Product saved: {product_file}")
@@ -2153,10 +2448,9 @@ class AmazonScraper:
                 'config': self.config
             }
             
-            import json
             output_file = f"test_single_subcategory_{self.market}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(test_results, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                f.write(json_dumps(test_results, indent=True))
             
             safe_print(f"[SAVE] Saved {products_saved} individual product files for your site")
             
@@ -2226,6 +2520,8 @@ if __name__ == "__main__":
     parser.add_argument('--speed', '-s', default='normal',
                        choices=['normal', 'fast', 'turbo'],
                        help='Speed mode: normal (balanced), fast (faster), turbo (maximum speed)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not update the 24h page cache')
     
     args = parser.parse_args()
     
@@ -2235,7 +2531,7 @@ if __name__ == "__main__":
     safe_print(f"[SPEED] Mode: ULTRA SPEED OPTIMIZED (Workers: 16, Delays: 0.3-1.0s, Session: 20 req)")
     safe_print(f"[PERFORMANCE] Expected: 400-500 products in 15 minutes (27-33 products/min)")
     
-    scraper = AmazonScraper(market=args.country)
+    scraper = AmazonScraper(market=args.country, use_cache=not args.no_cache)
     
     if not scraper.categories:
         safe_print("[ERROR] No categories found!")
@@ -2255,9 +2551,11 @@ if __name__ == "__main__":
     if args.test_single:
         safe_print("\n[TEST] Single category test mode")
         scraper.test_single_category()
+        scraper.close()
         exit(0)
     
     # Automatically run full scraping
     safe_print(f"\n[START] Running FULL scraping ({len(scraper.categories)} categories)...")
     safe_print("[INFO] This will take several hours. Starting automatically...")
-    scraper.scrape_all_categories() 
\ No newline at end of file
+    scraper.scrape_all_categories() 
+    scraper.close()
\ No newline at end of file